@@ -0,0 +1,89 @@
+"""
+Compare serial formset rendering with rendering on a thread pool.
+
+Run from the root of the repository:
+
+    uv run python benchmarks/formset_executor.py
+
+For every formset size, the script prints the median time of serial rendering and of rendering on a
+ThreadPoolExecutor. It reports the smallest size from which the executor is faster by at least ``--margin`` for that
+size and every larger size. Use that size as ``executor_threshold``. Smaller differences are noise. Threads only speed
+up rendering if they can run Python in parallel, e.g. on a free-threaded Python build.
+"""
+
+import argparse
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import django
+from django.conf import settings
+
+settings.configure(
+    INSTALLED_APPS=["bootstrap4"],
+    TEMPLATES=[{"BACKEND": "django.template.backends.django.DjangoTemplates", "APP_DIRS": True}],
+    USE_I18N=False,
+)
+django.setup()
+
+from django import forms  # noqa: E402
+
+from bootstrap4.forms import render_formset  # noqa: E402
+
+
+class RowForm(forms.Form):
+    name = forms.CharField(help_text="Name of the row")
+    email = forms.EmailField()
+    quantity = forms.IntegerField(min_value=0)
+    kind = forms.ChoiceField(choices=[("a", "A"), ("b", "B"), ("c", "C")])
+    active = forms.BooleanField(required=False)
+
+
+def time_render(formset, repeat, **kwargs):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        render_formset(formset, **kwargs)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[50, 100, 200, 500, 1000, 2000])
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--chunk-size", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--margin", type=float, default=0.1, help="minimum relative speedup to count as faster (default: 0.1)"
+    )
+    args = parser.parse_args()
+
+    speedups = {}
+    print(f"{'forms':>8} {'serial (s)':>12} {'executor (s)':>14} {'speedup':>8}")
+    with ThreadPoolExecutor(max_workers=args.workers) as executor:
+        for size in args.sizes:
+            RowFormSet = forms.formset_factory(RowForm, extra=size)
+            formset = RowFormSet()
+            serial = time_render(formset, args.repeat)
+            parallel = time_render(
+                formset, args.repeat, executor=executor, executor_threshold=0, executor_chunk_size=args.chunk_size
+            )
+            speedups[size] = serial / parallel
+            print(f"{size:>8} {serial:>12.4f} {parallel:>14.4f} {speedups[size]:>8.2f}")
+
+    # The executor should be faster for the crossover size and all larger sizes
+    crossover = None
+    for size in sorted(speedups, reverse=True):
+        if speedups[size] < 1 + args.margin:
+            break
+        crossover = size
+
+    if crossover is None:
+        print(f"The executor was not faster by {args.margin:.0%} or more for the largest formset size.")
+    else:
+        print(f"The executor was faster by {args.margin:.0%} or more from {crossover} forms.")
+
+
+if __name__ == "__main__":
+    main()
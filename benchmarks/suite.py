@@ -0,0 +1,264 @@
+"""
+Benchmark the public renderers and template tags of django-bootstrap4.
+
+Run from the root of the repository (no network access needed):
+
+    uv run python -m benchmarks.suite
+    uv run python -m benchmarks.suite -k render_form --json results.json
+
+Store a baseline with ``--json baseline.json`` and compare a later run with ``--compare baseline.json``. The comparison
+exits with status 1 if a benchmark got slower than ``--tolerance`` or uses more memory than ``--memory-tolerance``
+(both relative to the baseline). Peak memory hardly changes between runs, so it is a reliable signal on shared CI
+machines where timings are noisy.
+
+Every benchmark is calibrated to run for at least ``--min-time`` seconds per round. The median time of
+``--rounds`` rounds gives the throughput. Peak memory is measured with tracemalloc in a separate call, so tracing does
+not affect the timings.
+"""
+
+import argparse
+import copy
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from importlib.metadata import version
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "tests.app.settings")
+
+import django  # noqa: E402
+
+django.setup()
+
+from django.contrib.messages import constants as message_constants  # noqa: E402
+from django.contrib.messages.storage.base import Message  # noqa: E402
+from django.core.paginator import Paginator  # noqa: E402
+from django.forms import formset_factory  # noqa: E402
+from django.template import Context, Template  # noqa: E402
+from tests.forms import TestForm  # noqa: E402
+
+from bootstrap4.components import render_alert  # noqa: E402
+from bootstrap4.forms import render_field, render_form, render_formset  # noqa: E402
+from bootstrap4.templatetags.bootstrap4 import (  # noqa: E402
+    get_cached_pagination_context,
+    get_pagination_context,
+    render_cached_pagination,
+)
+
+# Number of copies of the TestForm fields in the synthetic forms
+FORM_SIZES = {"small": 1, "medium": 5, "huge": 40}
+
+
+def make_form_class(size):
+    """Return a form class with ``FORM_SIZES[size]`` copies of the fields of TestForm."""
+    copies = FORM_SIZES[size]
+    if copies == 1:
+        return TestForm
+    fields = {
+        f"{name}_{index}": copy.deepcopy(field)
+        for index in range(1, copies)
+        for name, field in TestForm.base_fields.items()
+        if name != "polygon"
+    }
+    return type(f"{size.title()}TestForm", (TestForm,), fields)
+
+
+def make_form_data(form_class):
+    """Return data for a bound form with some valid and some invalid values."""
+    data = {}
+    for name in form_class.base_fields:
+        if name.startswith("subject"):
+            data[name] = "subject"
+        elif name.startswith("sender"):
+            data[name] = "not an e-mail address"
+    return data
+
+
+def render_template(source, context=None):
+    template = Template("{% load bootstrap4 %}" + source)
+    context = Context(context or {})
+    return lambda: template.render(context)
+
+
+def get_benchmarks():
+    """Return a dict with a callable for each benchmark."""
+    benchmarks = {}
+
+    for size in FORM_SIZES:
+        form_class = make_form_class(size)
+        unbound_form = form_class()
+        bound_form = form_class(data=make_form_data(form_class))
+        bound_form.is_valid()
+        benchmarks[f"render_form[{size}]"] = lambda form=unbound_form: render_form(form)
+        benchmarks[f"render_form[{size},bound]"] = lambda form=bound_form: render_form(form)
+        benchmarks[f"render_form[{size},horizontal]"] = lambda form=unbound_form: render_form(form, layout="horizontal")
+
+    for total_forms in (10, 100):
+        formset = formset_factory(TestForm, extra=total_forms)()
+        benchmarks[f"render_formset[{total_forms}]"] = lambda formset=formset: render_formset(formset)
+
+    # One field for each widget type of TestForm
+    form = TestForm()
+    widget_types = {}
+    for field in form:
+        widget_types.setdefault(field.field.widget.__class__.__name__, field)
+    for widget_type, field in widget_types.items():
+        benchmarks[f"render_field[{widget_type}]"] = lambda field=field: render_field(field)
+
+    paginator = Paginator(range(10000), 10)
+    page = paginator.page(500)
+    get_context = lambda: get_pagination_context(page, url="/items/?sort=name&page=1")  # noqa: E731
+    render_pagination = render_template(
+        '{% bootstrap_pagination page url="/items/?sort=name&page=1" %}', {"page": page}
+    )
+    # The uncached benchmarks clear the LRU caches, so they measure computing the context and rendering the template
+    benchmarks["get_pagination_context"] = lambda: (get_cached_pagination_context.cache_clear(), get_context())
+    benchmarks["get_pagination_context[cached]"] = get_context
+    benchmarks["bootstrap_pagination"] = lambda: (
+        get_cached_pagination_context.cache_clear(),
+        render_cached_pagination.cache_clear(),
+        render_pagination(),
+    )
+    benchmarks["bootstrap_pagination[cached]"] = render_pagination
+    messages = [
+        Message(level, f"Message {index} for https://example.com/", extra_tags="extra")
+        for index, level in enumerate(message_constants.DEFAULT_LEVELS.values())
+    ]
+    benchmarks["bootstrap_messages"] = render_template("{% bootstrap_messages messages %}", {"messages": messages})
+    benchmarks["bootstrap_css"] = render_template("{% bootstrap_css %}")
+    benchmarks["bootstrap_javascript"] = render_template("{% bootstrap_javascript jquery=True %}")
+    benchmarks["render_alert"] = lambda: render_alert("Something <b>happened</b>", alert_type="warning")
+
+    return benchmarks
+
+
+def calibrate(func, min_time):
+    """Return the number of calls that take at least min_time seconds."""
+    iterations = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(iterations):
+            func()
+        if time.perf_counter() - start >= min_time:
+            return iterations
+        iterations *= 2
+
+
+def measure_peak_memory(func):
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def run_benchmark(func, rounds, min_time):
+    func()  # Warm up caches
+    iterations = calibrate(func, min_time)
+    timings = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for _ in range(iterations):
+            func()
+        timings.append((time.perf_counter() - start) / iterations)
+    median = statistics.median(timings)
+    return {
+        "iterations": iterations,
+        "rounds": rounds,
+        "median_s": median,
+        "min_s": min(timings),
+        "stdev_s": statistics.stdev(timings) if rounds > 1 else 0.0,
+        "ops_per_s": 1 / median,
+        "peak_memory_bytes": measure_peak_memory(func),
+    }
+
+
+def get_metadata():
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "django": django.get_version(),
+        "django-bootstrap4": version("django-bootstrap4"),
+    }
+
+
+def print_results(results):
+    width = max(len(name) for name in results)
+    print(f"{'benchmark':<{width}} {'median (ms)':>12} {'ops/s':>10} {'peak mem (KiB)':>15}")
+    for name, result in results.items():
+        print(
+            f"{name:<{width}} {result['median_s'] * 1000:>12.3f} {result['ops_per_s']:>10.1f}"
+            f" {result['peak_memory_bytes'] / 1024:>15.1f}"
+        )
+
+
+def compare(baseline, results, tolerance, memory_tolerance):
+    """Print the changes relative to the baseline, and return the names of the benchmarks that regressed."""
+    regressions = []
+    width = max(len(name) for name in results)
+    print(f"\n{'benchmark':<{width}} {'time':>8} {'memory':>8}")
+    for name, result in results.items():
+        if name not in baseline:
+            print(f"{name:<{width}} {'new':>8} {'new':>8}")
+            continue
+        time_change = result["median_s"] / baseline[name]["median_s"] - 1
+        memory_change = result["peak_memory_bytes"] / max(baseline[name]["peak_memory_bytes"], 1) - 1
+        regressed = time_change > tolerance or memory_change > memory_tolerance
+        if regressed:
+            regressions.append(name)
+        print(f"{name:<{width}} {time_change:>+8.1%} {memory_change:>+8.1%}{'  REGRESSION' if regressed else ''}")
+    return regressions
+
+
+def get_parser():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-k", dest="keyword", default="", help="only run benchmarks with this text in their name")
+    parser.add_argument("--rounds", type=int, default=5, help="number of timed rounds (default: 5)")
+    parser.add_argument("--min-time", type=float, default=0.2, help="minimum seconds per round (default: 0.2)")
+    parser.add_argument("--json", dest="json_path", help="write the results to this JSON file")
+    parser.add_argument("--compare", dest="baseline_path", help="compare the results with this JSON file")
+    parser.add_argument(
+        "--tolerance", type=float, default=0.2, help="allowed relative increase of the median time (default: 0.2)"
+    )
+    parser.add_argument(
+        "--memory-tolerance",
+        type=float,
+        default=0.05,
+        help="allowed relative increase of the peak memory (default: 0.05)",
+    )
+    return parser
+
+
+def run(args):
+    """Run the selected benchmarks and return the results with metadata."""
+    results = {}
+    for name, func in get_benchmarks().items():
+        if args.keyword in name:
+            results[name] = run_benchmark(func, args.rounds, args.min_time)
+    return {"metadata": get_metadata(), "results": results}
+
+
+def main():
+    args = get_parser().parse_args()
+    report = run(args)
+    if not report["results"]:
+        sys.exit(f"No benchmarks match {args.keyword!r}.")
+    print_results(report["results"])
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            json.dump(report, f, indent=2)
+    if args.baseline_path:
+        with open(args.baseline_path) as f:
+            baseline = json.load(f)["results"]
+        regressions = compare(baseline, report["results"], args.tolerance, args.memory_tolerance)
+        if regressions:
+            sys.exit(f"{len(regressions)} benchmark(s) regressed: {', '.join(regressions)}")
+
+
+if __name__ == "__main__":
+    main()
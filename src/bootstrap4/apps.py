@@ -0,0 +1,11 @@
+from django.apps import AppConfig
+from django.core import checks
+
+
+class Bootstrap4Config(AppConfig):
+    name = "bootstrap4"
+
+    def ready(self):
+        from .checks import check_renderers
+
+        checks.register(check_renderers)
@@ -1,6 +1,11 @@
 from importlib import import_module
+from types import MappingProxyType
 
 from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+
+from .signals import setting_read
 
 BOOTSTRAP4_DEFAULTS = {
     "css_url": {
@@ -33,6 +38,10 @@ BOOTSTRAP4_DEFAULTS = {
     "required_css_class": "",
     "error_css_class": "is-invalid",
     "success_css_class": "is-valid",
+    "form_cache_alias": "default",
+    "form_cache_timeout": 300,
+    # Check at startup (as a Django system check) that the renderer settings can be imported
+    "check_renderers": True,
     "formset_renderers": {"default": "bootstrap4.renderers.FormsetRenderer"},
     "form_renderers": {"default": "bootstrap4.renderers.FormRenderer"},
     "field_renderers": {
@@ -42,18 +51,50 @@ BOOTSTRAP4_DEFAULTS = {
 }
 
 
-def get_bootstrap_setting(name, default=None):
-    """Read a setting."""
-    # Start with a copy of default settings
-    BOOTSTRAP4 = BOOTSTRAP4_DEFAULTS.copy()
+# Settings that invalidate the merged settings when they change
+BOOTSTRAP4_SETTINGS_DEPENDENCIES = ("BOOTSTRAP4", "USE_I18N")
+
+_bootstrap_settings = None
+
+# Renderer classes resolved from the renderer settings, keyed by (setting name, layout)
+_renderers = {}
+
+
+def get_bootstrap_settings():
+    """
+    Return the merged settings as a read-only mapping.
+
+    The mapping is built on first use and rebuilt after one of ``BOOTSTRAP4_SETTINGS_DEPENDENCIES`` changes.
+    """
+    global _bootstrap_settings
+    if _bootstrap_settings is None:
+        # Start with a copy of default settings
+        BOOTSTRAP4 = BOOTSTRAP4_DEFAULTS.copy()
+
+        # Override with user settings from settings.py
+        BOOTSTRAP4.update(getattr(settings, "BOOTSTRAP4", {}))
+
+        # Update use_i18n
+        BOOTSTRAP4["use_i18n"] = i18n_enabled()
 
-    # Override with user settings from settings.py
-    BOOTSTRAP4.update(getattr(settings, "BOOTSTRAP4", {}))
+        _bootstrap_settings = MappingProxyType(BOOTSTRAP4)
+    return _bootstrap_settings
 
-    # Update use_i18n
-    BOOTSTRAP4["use_i18n"] = i18n_enabled()
 
-    return BOOTSTRAP4.get(name, default)
+@receiver(setting_changed)
+def reset_bootstrap_settings(*, setting, **kwargs):
+    """Discard the merged settings when the Django settings they depend on change."""
+    global _bootstrap_settings
+    if setting in BOOTSTRAP4_SETTINGS_DEPENDENCIES:
+        _bootstrap_settings = None
+        _renderers.clear()
+
+
+def get_bootstrap_setting(name, default=None):
+    """Read a setting."""
+    if setting_read.receivers:
+        setting_read.send(sender=None, name=name)
+    return get_bootstrap_settings().get(name, default)
 
 
 def jquery_url():
@@ -95,23 +136,35 @@ def i18n_enabled():
     return getattr(settings, "USE_I18N", False)
 
 
+def import_renderer(path):
+    """Return the renderer class for a dotted path."""
+    mod, cls = path.rsplit(".", 1)
+    return getattr(import_module(mod), cls)
+
+
 def get_renderer(renderers, **kwargs):
     layout = kwargs.get("layout", "")
     path = renderers.get(layout, renderers["default"])
-    mod, cls = path.rsplit(".", 1)
-    return getattr(import_module(mod), cls)
+    return import_renderer(path)
+
+
+def get_layout_renderer(name, layout=""):
+    """Return the renderer class for a layout from renderer setting ``name``, resolving it only once."""
+    key = (name, layout)
+    try:
+        return _renderers[key]
+    except KeyError:
+        renderer = _renderers[key] = get_renderer(get_bootstrap_setting(name), layout=layout)
+        return renderer
 
 
 def get_formset_renderer(**kwargs):
-    renderers = get_bootstrap_setting("formset_renderers")
-    return get_renderer(renderers, **kwargs)
+    return get_layout_renderer("formset_renderers", kwargs.get("layout", ""))
 
 
 def get_form_renderer(**kwargs):
-    renderers = get_bootstrap_setting("form_renderers")
-    return get_renderer(renderers, **kwargs)
+    return get_layout_renderer("form_renderers", kwargs.get("layout", ""))
 
 
 def get_field_renderer(**kwargs):
-    renderers = get_bootstrap_setting("field_renderers")
-    return get_renderer(renderers, **kwargs)
+    return get_layout_renderer("field_renderers", kwargs.get("layout", ""))
@@ -0,0 +1,44 @@
+from collections.abc import Mapping
+
+from django.core.checks import Error
+
+from .bootstrap import get_bootstrap_setting, import_renderer
+
+RENDERER_SETTINGS = ("formset_renderers", "form_renderers", "field_renderers")
+
+
+def check_renderers(app_configs=None, **kwargs):
+    """Check that every renderer in the renderer settings can be imported, unless the check_renderers setting is off."""
+    errors = []
+    if not get_bootstrap_setting("check_renderers", True):
+        return errors
+    for name in RENDERER_SETTINGS:
+        renderers = get_bootstrap_setting(name)
+        if not isinstance(renderers, Mapping):
+            errors.append(
+                Error(
+                    f'BOOTSTRAP4["{name}"] should be a dict of layouts and renderer paths.',
+                    hint=f"It is {renderers!r}.",
+                    id="bootstrap4.E003",
+                )
+            )
+            continue
+        if "default" not in renderers:
+            errors.append(
+                Error(
+                    f'BOOTSTRAP4["{name}"] has no "default" renderer.',
+                    id="bootstrap4.E001",
+                )
+            )
+        for layout, path in renderers.items():
+            try:
+                import_renderer(path)
+            except (ImportError, AttributeError, ValueError) as e:
+                errors.append(
+                    Error(
+                        f'BOOTSTRAP4["{name}"]["{layout}"] refers to renderer "{path}" that cannot be imported.',
+                        hint=str(e),
+                        id="bootstrap4.E002",
+                    )
+                )
+    return errors
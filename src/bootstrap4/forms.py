@@ -1,3 +1,4 @@
+from asgiref.sync import sync_to_async
 from django.forms import EmailInput, NumberInput, PasswordInput, Textarea, TextInput, URLInput
 from django.utils.safestring import mark_safe
 
@@ -15,6 +16,17 @@ def render_formset(formset, **kwargs):
     return renderer_cls(formset, **kwargs).render()
 
 
+def iter_render_formset(formset, **kwargs):
+    """Render a formset to a Bootstrap layout, yielding the HTML per form."""
+    renderer_cls = get_formset_renderer(**kwargs)
+    return renderer_cls(formset, **kwargs).iter_render()
+
+
+async def arender_formset(formset, **kwargs):
+    """Render a formset to a Bootstrap layout, giving control back to the event loop after each form."""
+    return await arender_chunks(iter_render_formset, formset, **kwargs)
+
+
 def render_formset_errors(formset, **kwargs):
     """Render formset errors to a Bootstrap layout."""
     renderer_cls = get_formset_renderer(**kwargs)
@@ -27,6 +39,17 @@ def render_form(form, **kwargs):
     return renderer_cls(form, **kwargs).render()
 
 
+def iter_render_form(form, **kwargs):
+    """Render a form to a Bootstrap layout, yielding the HTML per field."""
+    renderer_cls = get_form_renderer(**kwargs)
+    return renderer_cls(form, **kwargs).iter_render()
+
+
+async def arender_form(form, **kwargs):
+    """Render a form to a Bootstrap layout, giving control back to the event loop after each field."""
+    return await arender_chunks(iter_render_form, form, **kwargs)
+
+
 def render_form_errors(form, type="all", **kwargs):
     """Render form errors to a Bootstrap layout."""
     renderer_cls = get_form_renderer(**kwargs)
@@ -39,6 +62,26 @@ def render_field(field, **kwargs):
     return renderer_cls(field, **kwargs).render()
 
 
+async def arender_field(field, **kwargs):
+    """Render a field to a Bootstrap layout, without blocking the event loop."""
+    return await sync_to_async(render_field)(field, **kwargs)
+
+
+async def arender_chunks(iter_render, *args, **kwargs):
+    """
+    Join the chunks of an iter_render function, rendering each chunk with sync_to_async.
+
+    Rendering can access the database (e.g. the choices of a ModelChoiceField), so it runs in a sync context. Each
+    chunk is a separate call, so the event loop can run other tasks in between.
+    """
+    chunks = await sync_to_async(iter_render)(*args, **kwargs)
+    next_chunk = sync_to_async(next)
+    html = []
+    while (chunk := await next_chunk(chunks, None)) is not None:
+        html.append(chunk)
+    return mark_safe("".join(html))
+
+
 def render_label(content, label_for=None, label_class=None, label_title=""):
     """Render a label with content."""
     attrs = {}
@@ -0,0 +1,78 @@
+from django.core.paginator import EmptyPage, InvalidPage, Page, PageNotAnInteger, Paginator
+
+
+class CountlessPage(Page):
+    """Page of a CountlessPaginator, it knows if there is a next page without knowing the number of pages."""
+
+    def __init__(self, object_list, number, paginator, has_next):
+        super().__init__(object_list, number, paginator)
+        self._has_next = has_next
+
+    def has_next(self):
+        return self._has_next
+
+    def next_page_number(self):
+        if not self._has_next:
+            raise EmptyPage(self.paginator.error_messages["no_results"])
+        return self.number + 1
+
+    def previous_page_number(self):
+        return self.paginator.validate_number(self.number - 1)
+
+    def start_index(self):
+        if not self.object_list:
+            return 0
+        return (self.paginator.per_page * (self.number - 1)) + 1
+
+    def end_index(self):
+        return (self.paginator.per_page * (self.number - 1)) + len(self.object_list)
+
+
+class CountlessPaginator(Paginator):
+    """
+    Paginator that does not count the objects.
+
+    Every page fetches one object more than ``per_page`` to know if there is a next page, so no ``COUNT(*)`` query is
+    needed. ``num_pages`` is ``None``, which makes ``bootstrap_pagination`` render the count-free pagination.
+    ``page_range`` and ``get_elided_page_range`` need the number of pages and raise ``NotImplementedError``. ``count``
+    still works, but runs the ``COUNT(*)`` query.
+    """
+
+    num_pages = None
+
+    @property
+    def page_range(self):
+        raise NotImplementedError("CountlessPaginator does not know the number of pages, it has no page range.")
+
+    def get_elided_page_range(self, number=1, *, on_each_side=3, on_ends=2):
+        raise NotImplementedError("CountlessPaginator does not know the number of pages, it has no page range.")
+
+    def validate_number(self, number):
+        """Validate the given 1-based page number, without checking that the page exists."""
+        try:
+            if isinstance(number, float) and not number.is_integer():
+                raise ValueError
+            number = int(number)
+        except (TypeError, ValueError):
+            raise PageNotAnInteger(self.error_messages["invalid_page"])
+        if number < 1:
+            raise EmptyPage(self.error_messages["min_page"])
+        return number
+
+    def get_page(self, number):
+        """Return a valid page, the first page if the number is invalid or the page is empty."""
+        try:
+            return self.page(number)
+        except InvalidPage:
+            return self.page(1)
+
+    def page(self, number):
+        """Return a CountlessPage for the given 1-based page number."""
+        number = self.validate_number(number)
+        bottom = (number - 1) * self.per_page
+        object_list = list(self.object_list[bottom : bottom + self.per_page + 1])
+        has_next = len(object_list) > self.per_page
+        object_list = object_list[: self.per_page]
+        if not object_list and (number > 1 or not self.allow_empty_first_page):
+            raise EmptyPage(self.error_messages["no_results"])
+        return CountlessPage(object_list, number, self, has_next)
@@ -0,0 +1,85 @@
+import threading
+
+from debug_toolbar.panels import Panel
+from django.utils.translation import gettext_lazy as _
+from django.utils.translation import ngettext
+
+from .signals import field_rendered, setting_read, tag_rendered, template_loaded
+
+
+class Bootstrap4Panel(Panel):
+    """
+    Debug Toolbar panel that shows the bootstrap_* template tags rendered during a request.
+
+    Add ``"bootstrap4.panels.Bootstrap4Panel"`` to ``DEBUG_TOOLBAR_PANELS`` to use it. Only the tags, templates,
+    settings reads and ``list_to_class`` calls of the thread that handles the request are counted.
+    """
+
+    title = _("Bootstrap 4")
+    template = "bootstrap4/debug_toolbar/panel.html"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.thread_id = None
+        self.tags = []
+        self.template_loads = 0
+        self.cached_template_loads = 0
+        self.setting_reads = 0
+        self.list_to_class_parses = 0
+
+    @property
+    def nav_subtitle(self):
+        stats = self.get_stats()
+        if not stats:
+            return ""
+        count = len(stats["tags"])
+        return ngettext("%(count)d tag in %(time).1f ms", "%(count)d tags in %(time).1f ms", count) % {
+            "count": count,
+            "time": stats["total_time"],
+        }
+
+    def is_request_thread(self):
+        return threading.get_ident() == self.thread_id
+
+    def record_tag(self, tag_name, duration, **kwargs):
+        if self.is_request_thread():
+            self.tags.append({"name": tag_name, "time": duration * 1000})
+
+    def record_template_load(self, cached, **kwargs):
+        if self.is_request_thread():
+            self.template_loads += 1
+            if cached:
+                self.cached_template_loads += 1
+
+    def record_setting_read(self, **kwargs):
+        if self.is_request_thread():
+            self.setting_reads += 1
+
+    def record_field(self, list_to_class_applied, **kwargs):
+        if list_to_class_applied and self.is_request_thread():
+            self.list_to_class_parses += 1
+
+    def enable_instrumentation(self):
+        self.thread_id = threading.get_ident()
+        tag_rendered.connect(self.record_tag)
+        template_loaded.connect(self.record_template_load)
+        setting_read.connect(self.record_setting_read)
+        field_rendered.connect(self.record_field)
+
+    def disable_instrumentation(self):
+        tag_rendered.disconnect(self.record_tag)
+        template_loaded.disconnect(self.record_template_load)
+        setting_read.disconnect(self.record_setting_read)
+        field_rendered.disconnect(self.record_field)
+
+    def generate_stats(self, request, response):
+        self.record_stats(
+            {
+                "tags": self.tags,
+                "total_time": sum(tag["time"] for tag in self.tags),
+                "template_loads": self.template_loads,
+                "cached_template_loads": self.cached_template_loads,
+                "setting_reads": self.setting_reads,
+                "list_to_class_parses": self.list_to_class_parses,
+            }
+        )
@@ -0,0 +1,162 @@
+import threading
+import time
+from contextlib import ContextDecorator
+from contextvars import ContextVar
+from functools import wraps
+
+from .renderers import FieldRenderer
+
+# FieldRenderer methods that are timed, in the order in which FieldRenderer._render calls them
+STAGES = (
+    "add_widget_attrs",
+    "render_widget",
+    "post_widget_render",
+    "append_errors",
+    "append_help",
+    "add_label",
+    "wrap_label_and_field",
+)
+
+# Method that renders a whole field, its time is the total that the stages are part of
+TOTAL_STAGE = "_render"
+
+_current_profile = ContextVar("bootstrap4_profile", default=None)
+
+_patch_lock = threading.Lock()
+_patch_count = 0
+_originals = {}
+
+
+def get_renderer_classes(cls=FieldRenderer):
+    """Return FieldRenderer and all its subclasses."""
+    classes = [cls]
+    for subclass in cls.__subclasses__():
+        classes.extend(get_renderer_classes(subclass))
+    return classes
+
+
+def timed(stage, func):
+    """Return a wrapper around a FieldRenderer method that adds its time to the active profile."""
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        profile = _current_profile.get()
+        if profile is None or stage in profile.running:
+            # Not profiling, or a subclass method that calls super(), which is timed already
+            return func(*args, **kwargs)
+        profile.running.add(stage)
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            profile.running.discard(stage)
+            profile.add(stage, time.perf_counter() - start)
+
+    return wrapper
+
+
+def patch_renderers():
+    global _patch_count
+    with _patch_lock:
+        _patch_count += 1
+        if _patch_count > 1:
+            return
+        for cls in get_renderer_classes():
+            for stage in (*STAGES, TOTAL_STAGE):
+                if stage in cls.__dict__:
+                    _originals[(cls, stage)] = cls.__dict__[stage]
+                    setattr(cls, stage, timed(stage, cls.__dict__[stage]))
+
+
+def unpatch_renderers():
+    global _patch_count
+    with _patch_lock:
+        _patch_count -= 1
+        if _patch_count > 0:
+            return
+        for (cls, stage), func in _originals.items():
+            setattr(cls, stage, func)
+        _originals.clear()
+
+
+class profile_rendering(ContextDecorator):
+    """
+    Measure the time spent in the stages of FieldRenderer while rendering a template or view.
+
+    Use as a context manager::
+
+        with profile_rendering() as profile:
+            response = view(request)
+            response.render()
+        print(profile.report())
+
+    Or as a decorator, with a callback that receives the profile::
+
+        @profile_rendering(callback=lambda profile: logger.info(profile.report()))
+        def view(request):
+            ...
+
+    Only rendering in the current thread (or async task) is measured. ``render_widget`` is the time spent in Django
+    widget rendering (``BoundField.as_widget``), the other stages are post-processing by this library.
+    """
+
+    def __init__(self, callback=None):
+        self.callback = callback
+        self.stages = {}
+        self.running = set()
+        self.token = None
+
+    def _recreate_cm(self):
+        # A decorated function can run in multiple threads at once, every call gets its own profile
+        return self.__class__(callback=self.callback)
+
+    def __enter__(self):
+        patch_renderers()
+        self.token = _current_profile.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        _current_profile.reset(self.token)
+        unpatch_renderers()
+        if self.callback is not None:
+            self.callback(self)
+
+    def add(self, stage, duration):
+        calls, total = self.stages.get(stage, (0, 0.0))
+        self.stages[stage] = (calls + 1, total + duration)
+
+    @property
+    def fields(self):
+        """Return the number of rendered fields."""
+        return self.stages.get(TOTAL_STAGE, (0, 0.0))[0]
+
+    @property
+    def total(self):
+        """Return the time spent rendering fields, in seconds."""
+        return self.stages.get(TOTAL_STAGE, (0, 0.0))[1]
+
+    def as_dict(self):
+        """Return the calls and time (in seconds) per stage, with the time in ``other`` that no stage covers."""
+        stages = {stage: {"calls": calls, "time": total} for stage, (calls, total) in self.stages.items()}
+        stages.pop(TOTAL_STAGE, None)
+        return {
+            "fields": self.fields,
+            "total": self.total,
+            "stages": stages,
+            "other": self.total - sum(stage["time"] for stage in stages.values()),
+        }
+
+    def report(self):
+        """Return a text table with the time per stage."""
+        data = self.as_dict()
+        lines = [f"{data['fields']} fields rendered in {data['total'] * 1000:.2f} ms"]
+        rows = [
+            (stage, data["stages"][stage]["calls"], data["stages"][stage]["time"])
+            for stage in STAGES
+            if stage in data["stages"]
+        ]
+        rows.append(("other", "", data["other"]))
+        for stage, calls, total in rows:
+            share = total / data["total"] if data["total"] else 0.0
+            lines.append(f"  {stage:<22} {calls:>6} {total * 1000:>10.2f} ms {share:>7.1%}")
+        return "\n".join(lines)
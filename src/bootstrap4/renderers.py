@@ -1,4 +1,12 @@
-from bs4 import BeautifulSoup
+import copy
+import hashlib
+import threading
+import time
+from itertools import repeat
+
+from django.core.cache import caches
+from django.core.exceptions import EmptyResultSet
+from django.db import close_old_connections
 from django.forms import (
     BaseForm,
     BaseFormSet,
@@ -17,6 +25,8 @@ from django.forms import (
     TextInput,
     URLInput,
 )
+from django.utils import timezone, translation
+from django.utils.functional import Promise
 from django.utils.html import conditional_escape, escape, strip_tags
 from django.utils.safestring import mark_safe
 
@@ -30,8 +40,17 @@ from .forms import (
     render_form_group,
     render_label,
 )
+from .signals import field_rendered, form_rendered, formset_rendered
 from .text import text_value
-from .utils import add_css_class, render_template_file
+from .utils import (
+    add_choice_list_classes,
+    add_css_class,
+    is_template_overridden,
+    render_field_errors,
+    render_field_help,
+    render_template_file,
+)
+from .widgets import get_bootstrap_widget
 
 try:
     # If Django is set up without a database, importing this widget gives RuntimeError
@@ -40,8 +59,68 @@ except RuntimeError:
     ReadOnlyPasswordHashWidget = None
 
 
+def get_cache_key_value(value):
+    """Return a value for a cache key, with lazy strings resolved and lists and dicts as tuples."""
+    if isinstance(value, Promise):
+        return str(value)
+    if isinstance(value, (list, tuple)):
+        return tuple(get_cache_key_value(item) for item in value)
+    if isinstance(value, dict):
+        return tuple((key, get_cache_key_value(item)) for key, item in value.items())
+    return value
+
+
+def get_widget_fingerprint(widget):
+    """Return the class and attrs of a widget and its subwidgets, for a cache key."""
+    return (
+        widget.__class__.__module__,
+        widget.__class__.__qualname__,
+        get_cache_key_value(widget.attrs),
+        tuple(get_widget_fingerprint(subwidget) for subwidget in getattr(widget, "widgets", ())),
+    )
+
+
+def get_field_fingerprint(field):
+    """
+    Return what the HTML of a bound field depends on, next to its value and the render options, for a cache key.
+
+    Forms can change their fields in ``__init__``, e.g. set the choices or queryset per user. The fingerprint covers the
+    field and widget classes, label, help text, required and disabled state, widget attrs and choices. For a field with
+    a queryset, the SQL and parameters of the queryset stand in for the choices.
+    """
+    form_field = field.field
+    queryset = getattr(form_field, "queryset", None)
+    if queryset is not None:
+        try:
+            sql, params = queryset.query.sql_with_params()
+        except EmptyResultSet:
+            choices = ("queryset", None)
+        else:
+            choices = ("queryset", queryset.db, sql, get_cache_key_value(params))
+    else:
+        choices = get_cache_key_value(list(getattr(form_field, "choices", ())))
+    return (
+        form_field.__class__.__module__,
+        form_field.__class__.__qualname__,
+        get_cache_key_value(field.label),
+        get_cache_key_value(field.help_text),
+        form_field.required,
+        form_field.disabled,
+        form_field.show_hidden_initial,
+        get_widget_fingerprint(form_field.widget),
+        choices,
+    )
+
+
 class BaseRenderer:
-    """A content renderer."""
+    """
+    A content renderer.
+
+    If ``rendered_signal`` has receivers, ``render`` sends it with the duration of the rendering in seconds, the size
+    of the HTML and the keyword arguments from ``get_signal_kwargs``. Without receivers, nothing is measured.
+    """
+
+    rendered_signal = None
 
     def __init__(self, *args, **kwargs):
         self.layout = kwargs.get("layout", "")
@@ -81,18 +160,64 @@ class BaseRenderer:
     def _render(self):
         return ""
 
+    def get_signal_kwargs(self):
+        return {"layout": self.layout}
+
     def render(self):
-        return mark_safe(self._render())
+        signal = self.rendered_signal
+        if signal is None or not signal.receivers:
+            return mark_safe(self._render())
+        start = time.perf_counter()
+        html = mark_safe(self._render())
+        duration = time.perf_counter() - start
+        signal.send(
+            sender=self.__class__, renderer=self, duration=duration, html_size=len(html), **self.get_signal_kwargs()
+        )
+        return html
+
+    def iter_render(self):
+        """
+        Yield the rendered HTML in chunks.
+
+        Joining the chunks gives the same HTML as ``render``. Use this to stream large forms and formsets, e.g. with
+        ``StreamingHttpResponse``.
+        """
+        yield self.render()
 
 
 class FormsetRenderer(BaseRenderer):
-    """Default formset renderer."""
+    """
+    Default formset renderer.
+
+    Pass an ``executor`` (a ``concurrent.futures.ThreadPoolExecutor``) to render the forms of large formsets in chunks
+    on that executor. Formsets with fewer than ``executor_threshold`` forms are rendered serially. Process pools do not
+    work, forms refer to their form renderer and its template engine, which cannot be pickled.
+    """
+
+    rendered_signal = formset_rendered
+
+    # Minimum number of forms to render them on the executor. There is no default that is faster everywhere (threads
+    # only help on a free-threaded Python build), measure with benchmarks/formset_executor.py and set it per call.
+    EXECUTOR_THRESHOLD = 0
+
+    # Number of forms per chunk that is rendered on the executor
+    EXECUTOR_CHUNK_SIZE = 100
 
     def __init__(self, formset, *args, **kwargs):
         if not isinstance(formset, BaseFormSet):
             raise BootstrapError('Parameter "formset" should contain a valid Django Formset.')
         self.formset = formset
         super().__init__(*args, **kwargs)
+        self.executor = kwargs.get("executor", None)
+        self.executor_threshold = kwargs.get("executor_threshold", self.EXECUTOR_THRESHOLD)
+        self.executor_chunk_size = kwargs.get("executor_chunk_size", self.EXECUTOR_CHUNK_SIZE)
+        if self.executor_chunk_size < 1:
+            raise BootstrapError(
+                f'Invalid value "{self.executor_chunk_size}" for parameter "executor_chunk_size" (expected 1 or more).'
+            )
+
+    def get_signal_kwargs(self):
+        return {"formset": self.formset, **super().get_signal_kwargs()}
 
     def render_management_form(self):
         return text_value(self.formset.management_form)
@@ -100,26 +225,58 @@ class FormsetRenderer(BaseRenderer):
     def render_form(self, form, **kwargs):
         return render_form(form, **kwargs)
 
+    def get_form_kwargs(self):
+        return {
+            "layout": self.layout,
+            "form_group_class": self.form_group_class,
+            "field_class": self.field_class,
+            "label_class": self.label_class,
+            "show_label": self.show_label,
+            "show_help": self.show_help,
+            "exclude": self.exclude,
+            "set_placeholder": self.set_placeholder,
+            "size": self.size,
+            "horizontal_label_class": self.horizontal_label_class,
+            "horizontal_field_class": self.horizontal_field_class,
+        }
+
+    def render_form_chunk(self, forms, form_kwargs, language=None, time_zone=None, caller=None):
+        """
+        Render a list of forms, this runs on the executor.
+
+        The active language and time zone are thread local, so they are passed along and activated here. Database
+        connections that rendering opens in a worker thread (e.g. for the queryset of a ``ModelChoiceField``) are
+        closed afterwards, like at the end of a request.
+        """
+        with translation.override(language), timezone.override(time_zone):
+            rendered_forms = [self.render_form(form, **form_kwargs) for form in forms]
+        if caller != threading.get_ident():
+            # Never close the connections of the thread that renders the formset
+            close_old_connections()
+        return rendered_forms
+
+    def iter_render_forms(self):
+        form_kwargs = self.get_form_kwargs()
+        forms = self.formset.forms
+        if self.executor is None or len(forms) < self.executor_threshold:
+            for form in forms:
+                yield self.render_form(form, **form_kwargs)
+            return
+        chunk_size = self.executor_chunk_size
+        chunks = [forms[start : start + chunk_size] for start in range(0, len(forms), chunk_size)]
+        # Executor.map returns the results in the order of the chunks
+        for rendered_forms in self.executor.map(
+            self.render_form_chunk,
+            chunks,
+            repeat(form_kwargs),
+            repeat(translation.get_language()),
+            repeat(timezone.get_current_timezone()),
+            repeat(threading.get_ident()),
+        ):
+            yield from rendered_forms
+
     def render_forms(self):
-        rendered_forms = []
-        for form in self.formset.forms:
-            rendered_forms.append(
-                self.render_form(
-                    form,
-                    layout=self.layout,
-                    form_group_class=self.form_group_class,
-                    field_class=self.field_class,
-                    label_class=self.label_class,
-                    show_label=self.show_label,
-                    show_help=self.show_help,
-                    exclude=self.exclude,
-                    set_placeholder=self.set_placeholder,
-                    size=self.size,
-                    horizontal_label_class=self.horizontal_label_class,
-                    horizontal_field_class=self.horizontal_field_class,
-                )
-            )
-        return "\n".join(rendered_forms)
+        return "\n".join(self.iter_render_forms())
 
     def get_formset_errors(self):
         return self.formset.non_form_errors()
@@ -136,9 +293,20 @@ class FormsetRenderer(BaseRenderer):
     def _render(self):
         return "".join([self.render_errors(), self.render_management_form(), self.render_forms()])
 
+    def iter_render(self):
+        yield mark_safe(self.render_errors() + self.render_management_form())
+        for index, rendered_form in enumerate(self.iter_render_forms()):
+            yield mark_safe("\n" + rendered_form if index else rendered_form)
+
 
 class FormRenderer(BaseRenderer):
-    """Default form renderer."""
+    """
+    Default form renderer.
+
+    Pass ``cache=True`` to cache the HTML of unbound forms, see ``get_cache_key``.
+    """
+
+    rendered_signal = form_rendered
 
     def __init__(self, form, *args, **kwargs):
         if not isinstance(form, BaseForm):
@@ -150,31 +318,38 @@ class FormRenderer(BaseRenderer):
         self.bound_css_class = kwargs.get("bound_css_class", None)
         self.alert_error_type = kwargs.get("alert_error_type", "non_fields")
         self.form_check_class = kwargs.get("form_check_class", "form-check")
+        self.cache = kwargs.get("cache", False)
+        self.cache_version = kwargs.get("cache_version", None)
+
+    def get_signal_kwargs(self):
+        return {"form": self.form, **super().get_signal_kwargs()}
+
+    def get_field_kwargs(self):
+        return {
+            "layout": self.layout,
+            "form_group_class": self.form_group_class,
+            "field_class": self.field_class,
+            "label_class": self.label_class,
+            "form_check_class": self.form_check_class,
+            "show_label": self.show_label,
+            "show_help": self.show_help,
+            "exclude": self.exclude,
+            "set_placeholder": self.set_placeholder,
+            "size": self.size,
+            "horizontal_label_class": self.horizontal_label_class,
+            "horizontal_field_class": self.horizontal_field_class,
+            "error_css_class": self.error_css_class,
+            "required_css_class": self.required_css_class,
+            "bound_css_class": self.bound_css_class,
+        }
+
+    def iter_render_fields(self):
+        field_kwargs = self.get_field_kwargs()
+        for field in self.form:
+            yield render_field(field, **field_kwargs)
 
     def render_fields(self):
-        rendered_fields = []
-        for field in self.form:
-            rendered_fields.append(
-                render_field(
-                    field,
-                    layout=self.layout,
-                    form_group_class=self.form_group_class,
-                    field_class=self.field_class,
-                    label_class=self.label_class,
-                    form_check_class=self.form_check_class,
-                    show_label=self.show_label,
-                    show_help=self.show_help,
-                    exclude=self.exclude,
-                    set_placeholder=self.set_placeholder,
-                    size=self.size,
-                    horizontal_label_class=self.horizontal_label_class,
-                    horizontal_field_class=self.horizontal_field_class,
-                    error_css_class=self.error_css_class,
-                    required_css_class=self.required_css_class,
-                    bound_css_class=self.bound_css_class,
-                )
-            )
-        return "\n".join(rendered_fields)
+        return "\n".join(self.iter_render_fields())
 
     def get_fields_errors(self):
         form_errors = []
@@ -200,16 +375,94 @@ class FormRenderer(BaseRenderer):
 
         return ""
 
+    def get_cache_key(self):
+        """
+        Return the key to cache the HTML of the form with, or None if the form should not be cached.
+
+        The key depends on the renderer and form classes, the render options, the form prefix and other form
+        attributes, the fields as they are on this form instance (see ``get_field_fingerprint``), the initial values,
+        the active language and time zone, and ``cache_version``. Change ``cache_version`` when the HTML changes for
+        another reason, e.g. when the rows behind the queryset of a ``ModelChoiceField`` change.
+
+        Bound forms are not cached. Neither are forms with a callable initial value, since that value may be different
+        for each request.
+        """
+        if not self.cache or self.form.is_bound:
+            return None
+        form = self.form
+        initial = []
+        for name, field in form.fields.items():
+            if callable(form.initial.get(name, field.initial)):
+                return None
+            initial.append((name, form[name].value(), get_field_fingerprint(form[name])))
+        key = (
+            self.__class__.__module__,
+            self.__class__.__qualname__,
+            form.__class__.__module__,
+            form.__class__.__qualname__,
+            form.prefix,
+            form.auto_id,
+            form.label_suffix,
+            form.empty_permitted,
+            form.use_required_attribute,
+            tuple(self.get_field_kwargs().items()),
+            self.alert_error_type,
+            tuple(initial),
+            translation.get_language(),
+            timezone.get_current_timezone_name(),
+            self.cache_version,
+        )
+        return "bootstrap4.form." + hashlib.sha256(repr(key).encode()).hexdigest()
+
     def _render(self):
-        return self.render_errors(self.alert_error_type) + self.render_fields()
+        cache_key = self.get_cache_key()
+        if cache_key is None:
+            return self.render_errors(self.alert_error_type) + self.render_fields()
+        cache = caches[get_bootstrap_setting("form_cache_alias")]
+        html = cache.get(cache_key)
+        if html is None:
+            html = str(self.render_errors(self.alert_error_type) + self.render_fields())
+            cache.set(cache_key, html, get_bootstrap_setting("form_cache_timeout"))
+        return html
+
+    def iter_render(self):
+        if self.cache:
+            # A cached form is a single chunk
+            yield self.render()
+            return
+        yield mark_safe(self.render_errors(self.alert_error_type))
+        for index, rendered_field in enumerate(self.iter_render_fields()):
+            yield mark_safe("\n" + rendered_field if index else rendered_field)
 
 
 class FieldRenderer(BaseRenderer):
-    """Default field renderer."""
+    """
+    Default field renderer.
+
+    The field and its widget are never changed, so the same form can be rendered from multiple threads at once.
+
+    Pass ``cache=True`` to cache the HTML of the widget, see ``get_widget_cache_key``.
+    """
 
     # These widgets will not be wrapped in a form-control class
     WIDGETS_NO_FORM_CONTROL = (CheckboxInput, RadioSelect, CheckboxSelectMultiple, FileInput)
 
+    # Render options that change the HTML of a field with the same widget, part of the widget cache key
+    WIDGET_CACHE_KEY_OPTIONS = (
+        "layout",
+        "size",
+        "field_class",
+        "label_class",
+        "show_label",
+        "horizontal_label_class",
+        "horizontal_field_class",
+    )
+
+    rendered_signal = field_rendered
+
+    # Widget attrs that configure the input group addons, these are not rendered
+    ADDON_ATTRS = ("addon_before", "addon_after", "addon_before_class", "addon_after_class")
+
     def __init__(self, field, *args, **kwargs):
         if not isinstance(field, BoundField):
             raise BootstrapError('Parameter "field" should contain a valid Django BoundField.')
@@ -217,11 +470,14 @@ class FieldRenderer(BaseRenderer):
         super().__init__(*args, **kwargs)
 
         self.widget = field.field.widget
+        self.bootstrap_widget = None
+        self.list_to_class_applied = False
         self.is_multi_widget = isinstance(field.field.widget, MultiWidget)
-        self.initial_attrs = self.widget.attrs.copy()
         self.field_help = text_value(mark_safe(field.help_text)) if self.show_help and field.help_text else ""
         self.field_errors = [conditional_escape(text_value(error)) for error in field.errors]
         self.form_check_class = kwargs.get("form_check_class", "form-check")
+        self.cache = kwargs.get("cache", False)
+        self.cache_version = kwargs.get("cache_version", None)
 
         if "placeholder" in kwargs:
             # Find the placeholder in kwargs, even if it's empty
@@ -235,13 +491,13 @@ class FieldRenderer(BaseRenderer):
         if self.placeholder:
             self.placeholder = text_value(self.placeholder)
 
-        self.addon_before = kwargs.get("addon_before", self.widget.attrs.pop("addon_before", ""))
-        self.addon_after = kwargs.get("addon_after", self.widget.attrs.pop("addon_after", ""))
+        self.addon_before = kwargs.get("addon_before", self.widget.attrs.get("addon_before", ""))
+        self.addon_after = kwargs.get("addon_after", self.widget.attrs.get("addon_after", ""))
         self.addon_before_class = kwargs.get(
-            "addon_before_class", self.widget.attrs.pop("addon_before_class", "input-group-text")
+            "addon_before_class", self.widget.attrs.get("addon_before_class", "input-group-text")
         )
         self.addon_after_class = kwargs.get(
-            "addon_after_class", self.widget.attrs.pop("addon_after_class", "input-group-text")
+            "addon_after_class", self.widget.attrs.get("addon_after_class", "input-group-text")
         )
 
         # These are set in Django or in the global BOOTSTRAP4 settings, and
@@ -268,13 +524,10 @@ class FieldRenderer(BaseRenderer):
         if self.field.form.empty_permitted:
             self.required_css_class = ""
 
-    def restore_widget_attrs(self):
-        self.widget.attrs = self.initial_attrs.copy()
-
-    def add_class_attrs(self, widget=None):
+    def add_class_attrs(self, attrs, widget=None):
         if widget is None:
             widget = self.widget
-        classes = widget.attrs.get("class", "")
+        classes = attrs.get("class", "")
         if ReadOnlyPasswordHashWidget is not None and isinstance(widget, ReadOnlyPasswordHashWidget):
             # Render this is a static control
             classes = add_css_class(classes, "form-control-static", prepend=True)
@@ -294,51 +547,142 @@ class FieldRenderer(BaseRenderer):
             if self.field.form.is_bound:
                 classes = add_css_class(classes, self.success_css_class)
 
-        widget.attrs["class"] = classes
+        attrs["class"] = classes
 
-    def add_placeholder_attrs(self, widget=None):
+    def add_placeholder_attrs(self, attrs, widget=None):
         if widget is None:
             widget = self.widget
-        placeholder = widget.attrs.get("placeholder", self.placeholder)
+        placeholder = attrs.get("placeholder", self.placeholder)
         if placeholder and self.set_placeholder and is_widget_with_placeholder(widget):
             # TODO: Should this be stripped and/or escaped?
-            widget.attrs["placeholder"] = placeholder
+            attrs["placeholder"] = placeholder
 
-    def add_help_attrs(self, widget=None):
+    def add_help_attrs(self, attrs, widget=None):
         if widget is None:
             widget = self.widget
         if not isinstance(widget, CheckboxInput):
-            widget.attrs["title"] = widget.attrs.get("title", escape(strip_tags(self.field_help)))
+            attrs["title"] = attrs.get("title", escape(strip_tags(self.field_help)))
+
+    def get_choice_list_class(self):
+        if isinstance(self.widget, CheckboxSelectMultiple):
+            return "checkbox"
+        if isinstance(self.widget, RadioSelect):
+            return "radio radio-success"
+        return ""
+
+    def get_bootstrap_widget(self, widget=None):
+        """Return a copy of the widget that renders Bootstrap markup from a template, or None."""
+        return get_bootstrap_widget(
+            self.widget if widget is None else widget,
+            renderer=self.field.form.renderer,
+            list_class=add_css_class(self.get_choice_list_class(), self.get_size_class()),
+            item_class=self.form_check_class,
+        )
+
+    def get_widget_attrs(self, widget):
+        """Return a new dict with the attrs of a widget, without the addon attrs."""
+        return {key: value for key, value in widget.attrs.items() if key not in self.ADDON_ATTRS}
 
     def add_widget_attrs(self):
-        if self.is_multi_widget:
-            widgets = self.widget.widgets
-        else:
-            widgets = [self.widget]
-        for widget in widgets:
-            self.add_class_attrs(widget)
-            self.add_placeholder_attrs(widget)
-            self.add_help_attrs(widget)
+        """
+        Return the attrs to render the widget with, and for a MultiWidget the attrs of each of its widgets.
+
+        The Bootstrap attributes are added to new dicts, the widgets of the field are not changed. This makes it safe
+        to render the same form from multiple threads at the same time.
+        """
+        attrs = self.get_widget_attrs(self.widget)
+        if not self.is_multi_widget:
+            self.add_class_attrs(attrs, self.widget)
+            self.add_placeholder_attrs(attrs, self.widget)
+            self.add_help_attrs(attrs, self.widget)
+            return attrs, None
+        subwidget_attrs = []
+        for widget in self.widget.widgets:
+            widget_attrs = self.get_widget_attrs(widget)
+            self.add_class_attrs(widget_attrs, widget)
+            self.add_placeholder_attrs(widget_attrs, widget)
+            self.add_help_attrs(widget_attrs, widget)
+            subwidget_attrs.append(widget_attrs)
+        return attrs, subwidget_attrs
+
+    def get_render_widget(self, subwidget_attrs=None):
+        """
+        Return the widget to render.
+
+        This is the widget of the field, or a copy of it if the attrs of the widget contain addon attrs or if the
+        widgets of a MultiWidget need other attrs.
+        """
+        widget = self.widget
+        if subwidget_attrs is None and not any(key in widget.attrs for key in self.ADDON_ATTRS):
+            return widget
+        widget = copy.copy(widget)
+        widget.attrs = self.get_widget_attrs(self.widget)
+        if subwidget_attrs is not None:
+            widget.widgets = [
+                self.copy_widget_with_attrs(subwidget, attrs)
+                for subwidget, attrs in zip(self.widget.widgets, subwidget_attrs, strict=True)
+            ]
+        return widget
+
+    def copy_widget_with_attrs(self, widget, attrs):
+        widget = copy.copy(widget)
+        widget.attrs = attrs
+        return widget
+
+    def render_widget(self, widget, attrs):
+        return self.field.as_widget(widget=widget, attrs=attrs)
+
+    def get_widget_cache_key(self, attrs, subwidget_attrs=None):
+        """
+        Return the key to cache the HTML of the widget with, or None if the widget should not be cached.
+
+        This is meant for widgets with many choices, e.g. of a ``ModelChoiceField``. The cached HTML includes the work
+        of ``post_widget_render``, e.g. the label of a checkbox with the help text as its title. The key depends on the
+        widget and its attrs, the field as it is on the form instance (see ``get_field_fingerprint``, this includes the
+        label and the choices), the shown help text, the value, the error state, the form renderer, the active language
+        and ``cache_version``. Change ``cache_version`` when the rows behind the queryset of a ``ModelChoiceField``
+        change.
+        """
+        if not self.cache:
+            return None
+        field = self.field
+        key = (
+            self.__class__.__module__,
+            self.__class__.__qualname__,
+            self.widget.__class__.__module__,
+            self.widget.__class__.__qualname__,
+            field.html_name,
+            field.auto_id,
+            field.field.required,
+            field.field.disabled,
+            field.form.use_required_attribute,
+            field.form.renderer.__class__.__module__,
+            field.form.renderer.__class__.__qualname__,
+            get_field_fingerprint(field),
+            self.field_help,
+            bool(self.field_errors),
+            field.value(),
+            tuple(attrs.items()),
+            subwidget_attrs and tuple(tuple(widget_attrs.items()) for widget_attrs in subwidget_attrs),
+            tuple(getattr(self, name) for name in self.WIDGET_CACHE_KEY_OPTIONS),
+            self.form_check_class,
+            translation.get_language(),
+            self.cache_version,
+        )
+        return "bootstrap4.field." + hashlib.sha256(repr(key).encode()).hexdigest()
+
+    def get_signal_kwargs(self):
+        return {
+            "field": self.field,
+            "widget_class": self.widget.__class__,
+            "list_to_class_applied": self.list_to_class_applied,
+            **super().get_signal_kwargs(),
+        }
 
     def list_to_class(self, html, klass):
+        self.list_to_class_applied = True
         classes = add_css_class(klass, self.get_size_class())
-        soup = BeautifulSoup(html, features="html.parser")
-        enclosing_div = soup.find("div")
-        enclosing_div.attrs["class"] = classes
-        for inner_div in enclosing_div.find_all("div"):
-            inner_div.attrs["class"] = inner_div.attrs.get("class", []) + [self.form_check_class]
-        # Apply bootstrap4 classes to labels and inputs.
-        # A simple 'replace' isn't enough as we don't want to have several 'class' attr definition, which would happen
-        # if we tried to 'html.replace("input", "input class=...")'
-        enclosing_div = soup.find("div", {"class": classes})
-        if enclosing_div:
-            for label in enclosing_div.find_all("label"):
-                label.attrs["class"] = label.attrs.get("class", []) + ["form-check-label"]
-                try:
-                    label.input.attrs["class"] = label.input.attrs.get("class", []) + ["form-check-input"]
-                except AttributeError:
-                    pass
-        return str(soup)
+        return add_choice_list_classes(html, classes, self.form_check_class)
 
     def add_checkbox_label(self, html):
         return html + render_label(
@@ -361,6 +705,9 @@ class FieldRenderer(BaseRenderer):
         return html
 
     def post_widget_render(self, html):
+        if self.bootstrap_widget is not None:
+            # The Bootstrap template already rendered the Bootstrap markup
+            return html
         if isinstance(self.widget, CheckboxSelectMultiple):
             html = self.list_to_class(html, "checkbox")
         elif isinstance(self.widget, RadioSelect):
@@ -403,6 +750,8 @@ class FieldRenderer(BaseRenderer):
     def append_help(self, html):
         field_help = self.field_help or None
         if field_help:
+            if not is_template_overridden("bootstrap4/field_help_text.html"):
+                return html + render_field_help(field_help)
             help_html = render_template_file(
                 "bootstrap4/field_help_text.html",
                 context={
@@ -418,6 +767,8 @@ class FieldRenderer(BaseRenderer):
     def append_errors(self, html):
         field_errors = self.field_errors
         if field_errors:
+            if not is_template_overridden("bootstrap4/field_errors.html"):
+                return html + render_field_errors(field_errors)
             errors_html = render_template_file(
                 "bootstrap4/field_errors.html",
                 context={
@@ -514,11 +865,21 @@ class FieldRenderer(BaseRenderer):
         if self.field.is_hidden:
             return text_value(self.field)
         # Render the widget
-        self.add_widget_attrs()
-        html = self.field.as_widget(attrs=self.widget.attrs)
-        self.restore_widget_attrs()
+        attrs, subwidget_attrs = self.add_widget_attrs()
+        cache_key = self.get_widget_cache_key(attrs, subwidget_attrs)
+        if cache_key is None:
+            html = None
+        else:
+            cache = caches[get_bootstrap_setting("form_cache_alias")]
+            html = cache.get(cache_key)
+        if html is None:
+            widget = self.get_render_widget(subwidget_attrs)
+            self.bootstrap_widget = self.get_bootstrap_widget(widget)
+            html = self.render_widget(self.bootstrap_widget or widget, attrs)
+            html = self.post_widget_render(html)
+            if cache_key is not None:
+                cache.set(cache_key, str(html), get_bootstrap_setting("form_cache_timeout"))
         # Start post render
-        html = self.post_widget_render(html)
         html = self.append_to_checkbox_field(html)
         html = self.wrap_widget(html)
         html = self.make_input_group(html)
@@ -532,14 +893,15 @@ class FieldRenderer(BaseRenderer):
 class InlineFieldRenderer(FieldRenderer):
     """Inline field renderer."""
 
-    def add_error_attrs(self):
-        field_title = self.widget.attrs.get("title", "")
+    def add_error_attrs(self, attrs):
+        field_title = attrs.get("title", "")
         field_title += " " + " ".join([strip_tags(e) for e in self.field_errors])
-        self.widget.attrs["title"] = field_title.strip()
+        attrs["title"] = field_title.strip()
 
     def add_widget_attrs(self):
-        super().add_widget_attrs()
-        self.add_error_attrs()
+        attrs, subwidget_attrs = super().add_widget_attrs()
+        self.add_error_attrs(attrs)
+        return attrs, subwidget_attrs
 
     def append_to_field(self, html):
         return html
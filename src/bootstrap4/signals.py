@@ -0,0 +1,13 @@
+from django.dispatch import Signal
+
+# Sent after a renderer has rendered a formset, form or field, see BaseRenderer.render
+formset_rendered = Signal()
+form_rendered = Signal()
+field_rendered = Signal()
+
+# Sent after a bootstrap_* template tag has been rendered
+tag_rendered = Signal()
+
+# Sent when render_template_file looks up a template, and when a BOOTSTRAP4 setting is read
+template_loaded = Signal()
+setting_read = Signal()
@@ -1,13 +1,29 @@
+import time
+from contextvars import ContextVar
+from functools import lru_cache, wraps
 from math import floor
-from urllib.parse import parse_qs, urlparse, urlunparse
+from urllib.parse import parse_qs, quote_plus, urlparse, urlunparse
 
 from django import template
 from django.contrib.messages import constants as message_constants
+from django.core.signals import setting_changed
+from django.dispatch import receiver
 from django.template import Context
+from django.utils import translation
+from django.utils.autoreload import file_changed
+from django.utils.html import conditional_escape
 from django.utils.http import urlencode
 from django.utils.safestring import mark_safe
 
-from ..bootstrap import css_url, get_bootstrap_setting, javascript_url, jquery_slim_url, jquery_url, theme_url
+from ..bootstrap import (
+    BOOTSTRAP4_SETTINGS_DEPENDENCIES,
+    css_url,
+    get_bootstrap_setting,
+    javascript_url,
+    jquery_slim_url,
+    jquery_url,
+    theme_url,
+)
 from ..components import render_alert
 from ..forms import (
     render_button,
@@ -20,14 +36,17 @@ from ..forms import (
     render_formset_errors,
     render_label,
 )
+from ..signals import tag_rendered
 from ..utils import (
     handle_var,
+    is_template_overridden,
     parse_token_contents,
     render_link_tag,
     render_script_tag,
     render_tag,
     render_template_file,
     url_replace_param,
+    url_replace_param_template,
 )
 
 MESSAGE_LEVEL_CLASSES = {
@@ -38,7 +57,79 @@ MESSAGE_LEVEL_CLASSES = {
     message_constants.ERROR: "alert alert-danger",
 }
 
-register = template.Library()
+# Number of pagination contexts and rendered paginations that are kept in memory
+PAGINATION_CACHE_SIZE = 256
+
+
+# Whether a tag function is running, tag functions that other tag functions call are not reported
+_in_tag = ContextVar("bootstrap4_in_tag", default=False)
+
+
+def instrument_tag(func):
+    """Send tag_rendered after the tag function returns, if the signal has receivers."""
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        if not tag_rendered.receivers or _in_tag.get():
+            return func(*args, **kwargs)
+        token = _in_tag.set(True)
+        start = time.perf_counter()
+        try:
+            result = func(*args, **kwargs)
+        finally:
+            _in_tag.reset(token)
+        tag_rendered.send(sender=func, tag_name=func.__name__, duration=time.perf_counter() - start)
+        return result
+
+    return wrapper
+
+
+class BootstrapLibrary(template.Library):
+    """Template library that instruments its simple tags and inclusion tags, see ``instrument_tag``."""
+
+    def simple_tag(self, func=None, takes_context=None, name=None):
+        if callable(func):
+            return super().simple_tag(instrument_tag(func), takes_context, name)
+
+        def dec(func):
+            return super(BootstrapLibrary, self).simple_tag(instrument_tag(func), takes_context, name)
+
+        return dec
+
+    def inclusion_tag(self, filename, func=None, takes_context=None, name=None):
+        dec = super().inclusion_tag(filename, func, takes_context, name)
+        return lambda func: dec(instrument_tag(func))
+
+
+register = BootstrapLibrary()
+
+# HTML of bootstrap_css, bootstrap_jquery and bootstrap_javascript, keyed by tag name and jquery option
+_asset_html = {}
+
+
+@receiver(setting_changed)
+def reset_asset_html(*, setting, **kwargs):
+    """Discard the HTML of the asset tags when the settings it is built from change."""
+    if setting in BOOTSTRAP4_SETTINGS_DEPENDENCIES:
+        _asset_html.clear()
+
+
+def get_asset_html(key, render, *args):
+    """Return the HTML of an asset tag, render it only the first time."""
+    try:
+        return _asset_html[key]
+    except KeyError:
+        html = _asset_html[key] = render(*args)
+        return html
+
+
+def normalize_jquery(jquery):
+    """Return the jquery option of the asset tags as False, "slim" or True."""
+    if not jquery:
+        return False
+    if jquery == "slim":
+        return "slim"
+    return True
 
 
 @register.filter
@@ -75,6 +166,23 @@ def bootstrap_message_classes(message):
     return " ".join(classes).strip()
 
 
+def render_messages(messages):
+    """Render messages like `bootstrap4/messages.html` without going through the template engine."""
+    close = conditional_escape(translation.gettext("close"))
+    return (
+        "\n"
+        + "".join(
+            f'\n    <div class="{conditional_escape(bootstrap_message_classes(message))} alert-dismissible fade show"'
+            ' role="alert">\n'
+            f'        <button type="button" class="close" data-dismiss="alert" aria-label="{close}">&#215;</button>\n'
+            f"        {conditional_escape(str(message))}\n"
+            "    </div>\n"
+            for message in messages or ()
+        )
+        + "\n"
+    )
+
+
 @register.simple_tag
 def bootstrap_jquery_url():
     """
@@ -220,6 +328,10 @@ def bootstrap_css():
 
         {% bootstrap_css %}
     """
+    return get_asset_html(("css",), render_bootstrap_css)
+
+
+def render_bootstrap_css():
     rendered_urls = []
     if bootstrap_css_url():
         rendered_urls.append(render_link_tag(bootstrap_css_url()))
@@ -255,6 +367,11 @@ def bootstrap_jquery(jquery=True):
 
         {% bootstrap_jquery jquery='slim' %}
     """
+    jquery = normalize_jquery(jquery)
+    return get_asset_html(("jquery", jquery), render_bootstrap_jquery, jquery)
+
+
+def render_bootstrap_jquery(jquery):
     if not jquery:
         return ""
     elif jquery == "slim":
@@ -300,6 +417,11 @@ def bootstrap_javascript(jquery=False):
 
         {% bootstrap_javascript jquery="slim" %}
     """
+    jquery = normalize_jquery(jquery)
+    return get_asset_html(("javascript", jquery), render_bootstrap_javascript, jquery)
+
+
+def render_bootstrap_javascript(jquery):
     # List of JS tags to include
     javascript_tags = []
 
@@ -333,6 +455,20 @@ def bootstrap_formset(*args, **kwargs):
         formset
             The formset that is being rendered
 
+        executor
+            A ``concurrent.futures.Executor`` to render the forms on, in chunks
+
+            :default: ``None`` (render the forms one by one)
+
+        executor_threshold
+            Minimum number of forms to use the executor, measure with ``benchmarks/formset_executor.py``
+
+            :default: ``0`` (always use the executor)
+
+        executor_chunk_size
+            Number of forms per chunk that is rendered on the executor
+
+            :default: ``100``
 
         See bootstrap_field_ for other arguments
 
@@ -404,6 +540,16 @@ def bootstrap_form(*args, **kwargs):
 
                 :default: ``'non_fields'``
 
+        cache
+            Cache the HTML of an unbound form, see the ``form_cache_alias`` and ``form_cache_timeout`` settings
+
+            :default: ``False``
+
+        cache_version
+            Part of the cache key, change this to render the cached form again
+
+            :default: ``None``
+
         See bootstrap_field_ for other arguments
 
     **Usage**::
@@ -579,6 +725,17 @@ def bootstrap_field(*args, **kwargs):
 
             :default: ``'has-success'``. Can be changed :doc:`settings`
 
+        cache
+            Cache the HTML of the widget, for widgets with many choices. The errors, help text and label are rendered
+            as usual.
+
+            :default: ``False``
+
+        cache_version
+            Part of the cache key, change this when the choices change
+
+            :default: ``None``
+
     **Usage**::
 
         {% bootstrap_field field %}
@@ -816,15 +973,17 @@ def bootstrap_messages(context, *args, **kwargs):
         {% bootstrap_javascript jquery=True %}
         {% bootstrap_messages %}
     """
-    # Force Context to dict
+    if not is_template_overridden("bootstrap4/messages.html"):
+        return mark_safe(render_messages(context.get("messages")))
+    # An overridden template can use any variable, force Context to dict
     if isinstance(context, Context):
         context = context.flatten()
     context.update({"message_constants": message_constants})
     return render_template_file("bootstrap4/messages.html", context=context)
 
 
-@register.inclusion_tag("bootstrap4/pagination.html")
-def bootstrap_pagination(page, **kwargs):
+@register.simple_tag(takes_context=True)
+def bootstrap_pagination(context, page, **kwargs):
     """
     Render pagination for a page.
 
@@ -867,6 +1026,14 @@ def bootstrap_pagination(page, **kwargs):
 
             :default: ``'page'``
 
+        count
+            Whether to use the number of pages of the paginator. If ``False``, the pagination shows the pages before
+            the current page and, if ``page.has_next()``, the next page, and the last link goes to the next page.
+            This only avoids the ``COUNT(*)`` query if ``page.has_next()`` does not count, which is the case for pages
+            of ``bootstrap4.paginator.CountlessPaginator`` but not of Django's ``Paginator``.
+
+            :default: ``None`` (``False`` if the paginator has no ``num_pages``)
+
     **Usage**::
 
         {% bootstrap_pagination page %}
@@ -881,10 +1048,81 @@ def bootstrap_pagination(page, **kwargs):
       use the "extra" parameter with "request.GET.urlencode":
 
         {% bootstrap_pagination page_obj extra=request.GET.urlencode %}
+
+    **Caching**::
+
+      The rendered pagination is kept in a LRU cache of ``PAGINATION_CACHE_SIZE`` entries, keyed by the page number,
+      the number of pages, the parameters, the active language and the autoescape and localization settings of the
+      template context. Use ``render_cached_pagination.cache_info()`` for the hit and miss statistics.
+    """
+    args = get_pagination_args(page, **kwargs)
+    if not is_hashable(args):
+        return mark_safe(render_pagination(context.new(get_pagination_context_for_args(*args))))
+    return render_cached_pagination(
+        *args, translation.get_language(), context.autoescape, context.use_l10n, context.use_tz
+    )
+
+
+@register.inclusion_tag("bootstrap4/cursor_pagination.html")
+def bootstrap_cursor_pagination(next_cursor=None, previous_cursor=None, **kwargs):
+    """
+    Render pagination with previous and next links for cursor (keyset) pagination.
+
+    **Tag name**::
+
+        bootstrap_cursor_pagination
+
+    **Parameters**::
+
+        next_cursor
+            Opaque token for the next page, the next link is disabled if it is empty.
+
+            :default: ``None``
+
+        previous_cursor
+            Opaque token for the previous page, the previous link is disabled if it is empty.
+
+            :default: ``None``
+
+        url
+            URL to navigate to for pagination forward and pagination back.
+
+            :default: ``None``
+
+        size
+            Controls the size of the pagination through CSS. Defaults to being normal sized.
+
+            One of the following:
+
+                * ``'small'``
+                * ``'large'``
+
+            :default: ``None``
+
+        justify_content
+            Controls the alignment of the pagination, one of ``'start'``, ``'center'`` or ``'end'``.
+
+            :default: ``None``
+
+        extra
+            Any extra page parameters.
+
+            :default: ``None``
+
+        parameter_name
+            Name of the cursor URL parameter.
+
+            :default: ``'cursor'``
+
+    **Usage**::
+
+        {% bootstrap_cursor_pagination next_cursor=next_cursor previous_cursor=previous_cursor %}
+
+    **Example**::
+
+        {% bootstrap_cursor_pagination next_cursor=page.next_cursor url=request.get_full_path size="small" %}
     """
-    pagination_kwargs = kwargs.copy()
-    pagination_kwargs["page"] = page
-    return get_pagination_context(**pagination_kwargs)
+    return get_cursor_pagination_context(next_cursor=next_cursor, previous_cursor=previous_cursor, **kwargs)
 
 
 @register.simple_tag
@@ -893,47 +1131,190 @@ def bootstrap_url_replace_param(url, name, value):
 
 
 def get_pagination_context(
-    page, pages_to_show=11, url=None, size=None, justify_content=None, extra=None, parameter_name="page"
+    page, pages_to_show=11, url=None, size=None, justify_content=None, extra=None, parameter_name="page", count=None
+):
+    """
+    Generate Bootstrap pagination context from a page object.
+
+    The context is kept in a LRU cache, see ``get_cached_pagination_context``. Every call returns a copy.
+    """
+    args = get_pagination_args(page, pages_to_show, url, size, justify_content, extra, parameter_name, count)
+    if not is_hashable(args):
+        return get_pagination_context_for_args(*args)
+    context = get_cached_pagination_context(*args)
+    return {
+        **context,
+        "pages_shown": list(context["pages_shown"]),
+        "pages_shown_urls": list(context["pages_shown_urls"]),
+    }
+
+
+def get_pagination_args(
+    page, pages_to_show=11, url=None, size=None, justify_content=None, extra=None, parameter_name="page", count=None
 ):
-    """Generate Bootstrap pagination context from a page object."""
+    """Return the arguments of get_pagination_context_for_args, they do not include the page object."""
     pages_to_show = int(pages_to_show)
     if pages_to_show < 1:
         raise ValueError(f"Pagination pages_to_show should be a positive integer, you specified {pages_to_show}.")
-    num_pages = page.paginator.num_pages
-    current_page = page.number
+    if count is None:
+        # Look at the class, Paginator.num_pages is a cached_property that runs the count query
+        count = getattr(type(page.paginator), "num_pages", None) is not None
+    if count:
+        num_pages, has_next = page.paginator.num_pages, None
+    else:
+        num_pages, has_next = None, page.has_next()
+    return page.number, num_pages, has_next, pages_to_show, url, size, justify_content, extra, parameter_name
+
+
+def is_hashable(value):
+    try:
+        hash(value)
+    except TypeError:
+        return False
+    return True
+
+
+def get_pagination_context_for_args(
+    current_page, num_pages, has_next, pages_to_show, url, size, justify_content, extra, parameter_name
+):
+    """Generate Bootstrap pagination context, count-free if num_pages is None."""
+    count = num_pages is not None
     half_page_num = int(floor(pages_to_show / 2))
     if half_page_num < 0:
         half_page_num = 0
-    first_page = current_page - half_page_num
-    if first_page <= 1:
-        first_page = 1
-    if first_page > 1:
-        pages_back = first_page - half_page_num
-        if pages_back < 1:
-            pages_back = 1
-    else:
-        pages_back = None
-    last_page = first_page + pages_to_show - 1
-    if pages_back is None:
-        last_page += 1
-    if last_page > num_pages:
-        last_page = num_pages
-    if last_page < num_pages:
-        pages_forward = last_page + half_page_num
-        if pages_forward > num_pages:
-            pages_forward = num_pages
-    else:
-        pages_forward = None
+    if count:
+        first_page = current_page - half_page_num
+        if first_page <= 1:
+            first_page = 1
         if first_page > 1:
-            first_page -= 1
-        if pages_back is not None and pages_back > 1:
-            pages_back -= 1
+            pages_back = first_page - half_page_num
+            if pages_back < 1:
+                pages_back = 1
         else:
             pages_back = None
+        last_page = first_page + pages_to_show - 1
+        if pages_back is None:
+            last_page += 1
+        if last_page > num_pages:
+            last_page = num_pages
+        if last_page < num_pages:
+            pages_forward = last_page + half_page_num
+            if pages_forward > num_pages:
+                pages_forward = num_pages
+        else:
+            pages_forward = None
+            if first_page > 1:
+                first_page -= 1
+            if pages_back is not None and pages_back > 1:
+                pages_back -= 1
+            else:
+                pages_back = None
+    else:
+        # Without the number of pages, slide a window over the previous pages and the next page
+        first_page = max(current_page - half_page_num, 1)
+        pages_back = max(first_page - half_page_num, 1) if first_page > 1 else None
+        last_page = current_page + 1 if has_next else current_page
+        pages_forward = None
     pages_shown = []
     for i in range(first_page, last_page + 1):
         pages_shown.append(i)
 
+    url = get_pagination_url(url, extra)
+
+    # URLs of the links, the url is parsed once for all pages
+    url_prefix, url_suffix = url_replace_param_template(url, parameter_name)
+
+    def page_url(number):
+        return mark_safe(f"{url_prefix}{number}{url_suffix}")
+
+    if count:
+        last_url = page_url(num_pages)
+    elif last_page > current_page:
+        # Without the number of pages, the last link goes to the next page
+        last_url = page_url(last_page)
+    else:
+        last_url = None
+
+    return {
+        "bootstrap_pagination_url": url,
+        "num_pages": num_pages,
+        "current_page": current_page,
+        "first_page": first_page,
+        "last_page": last_page,
+        "pages_shown": pages_shown,
+        "pages_back": pages_back,
+        "pages_forward": pages_forward,
+        "pagination_css_classes": get_pagination_css_classes(size, justify_content),
+        "parameter_name": parameter_name,
+        "first_url": page_url(1),
+        "last_url": last_url,
+        "pages_back_url": page_url(pages_back) if pages_back else None,
+        "pages_forward_url": page_url(pages_forward) if pages_forward else None,
+        "pages_shown_urls": [(number, page_url(number)) for number in pages_shown],
+    }
+
+
+get_cached_pagination_context = lru_cache(maxsize=PAGINATION_CACHE_SIZE)(get_pagination_context_for_args)
+
+
+def render_pagination(context):
+    return render_template_file("bootstrap4/pagination.html", context=context)
+
+
+@lru_cache(maxsize=PAGINATION_CACHE_SIZE)
+def render_cached_pagination(*args):
+    """
+    Render bootstrap4/pagination.html.
+
+    The last arguments are the language, autoescape, use_l10n and use_tz, because they affect the rendered HTML.
+    """
+    *args, language, autoescape, use_l10n, use_tz = args
+    context = Context(
+        dict(get_cached_pagination_context(*args)), autoescape=autoescape, use_l10n=use_l10n, use_tz=use_tz
+    )
+    return mark_safe(render_pagination(context))
+
+
+@receiver(setting_changed)
+def reset_pagination_cache_on_setting_changed(**kwargs):
+    """Discard the cached paginations, many settings (templates, localization, ...) affect them."""
+    get_cached_pagination_context.cache_clear()
+    render_cached_pagination.cache_clear()
+
+
+@receiver(file_changed)
+def reset_pagination_cache_on_file_changed(**kwargs):
+    """Discard the rendered paginations when the autoreloader sees a changed file, a template may have been edited."""
+    render_cached_pagination.cache_clear()
+
+
+def get_cursor_pagination_context(
+    next_cursor=None,
+    previous_cursor=None,
+    url=None,
+    size=None,
+    justify_content=None,
+    extra=None,
+    parameter_name="cursor",
+):
+    """Generate Bootstrap pagination context from the cursors of the next and previous pages."""
+    url = get_pagination_url(url, extra)
+    url_prefix, url_suffix = url_replace_param_template(url, parameter_name)
+
+    def cursor_url(cursor):
+        return mark_safe(f"{url_prefix}{quote_plus(str(cursor))}{url_suffix}") if cursor else None
+
+    return {
+        "bootstrap_pagination_url": url,
+        "next_url": cursor_url(next_cursor),
+        "previous_url": cursor_url(previous_cursor),
+        "pagination_css_classes": get_pagination_css_classes(size, justify_content),
+        "parameter_name": parameter_name,
+    }
+
+
+def get_pagination_url(url, extra=None):
+    """Return the url of the pagination links, with the extra querystring parameters."""
     # parse the url
     parts = urlparse(url or "")
     params = parse_qs(parts.query)
@@ -943,11 +1324,13 @@ def get_pagination_context(
         params.update(parse_qs(extra))
 
     # build url again.
-    url = urlunparse(
+    return urlunparse(
         [parts.scheme, parts.netloc, parts.path, parts.params, urlencode(params, doseq=True), parts.fragment]
     )
 
-    # Set CSS classes, see http://getbootstrap.com/components/#pagination
+
+def get_pagination_css_classes(size=None, justify_content=None):
+    """Return the CSS classes of a pagination, see http://getbootstrap.com/components/#pagination."""
     pagination_css_classes = ["pagination"]
     if size == "small":
         pagination_css_classes.append("pagination-sm")
@@ -961,15 +1344,4 @@ def get_pagination_context(
     elif justify_content == "end":
         pagination_css_classes.append("justify-content-end")
 
-    return {
-        "bootstrap_pagination_url": url,
-        "num_pages": num_pages,
-        "current_page": current_page,
-        "first_page": first_page,
-        "last_page": last_page,
-        "pages_shown": pages_shown,
-        "pages_back": pages_back,
-        "pages_forward": pages_forward,
-        "pagination_css_classes": " ".join(pagination_css_classes),
-        "parameter_name": parameter_name,
-    }
+    return " ".join(pagination_css_classes)
@@ -1,20 +1,77 @@
+import os
 import re
 from collections.abc import Mapping
-from urllib.parse import parse_qs, urlparse, urlunparse
+from html.parser import HTMLParser
+from urllib.parse import parse_qs, quote_plus, urlparse, urlunparse
 
+from django.core.signals import setting_changed
+from django.dispatch import receiver
 from django.forms.utils import flatatt
+from django.template import Context
 from django.template.base import FilterExpression, TemplateSyntaxError, Variable, VariableDoesNotExist, kwarg_re
 from django.template.loader import get_template
+from django.utils.autoreload import file_changed
 from django.utils.encoding import force_str
-from django.utils.html import format_html
+from django.utils.html import conditional_escape, format_html
 from django.utils.http import urlencode
 from django.utils.safestring import mark_safe
 
+from .signals import template_loaded
 from .text import text_value
 
 # RegEx for quoted string
 QUOTED_STRING = re.compile(r'^["\'](?P<noquotes>.+)["\']$')
 
+# Templates with this prefix are loaded once, see get_cached_template
+CACHED_TEMPLATE_PREFIX = "bootstrap4/"
+
+# Settings that invalidate the cached templates when they change
+CACHED_TEMPLATE_SETTINGS_DEPENDENCIES = ("TEMPLATES", "INSTALLED_APPS")
+
+# Directory with the templates shipped with this package, see is_template_overridden
+TEMPLATES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "templates")
+
+_templates = {}
+
+_overridden_templates = {}
+
+# Void elements are serialized as <tag/>
+VOID_ELEMENTS = {
+    "area",
+    "base",
+    "basefont",
+    "bgsound",
+    "br",
+    "col",
+    "command",
+    "embed",
+    "frame",
+    "hr",
+    "image",
+    "img",
+    "input",
+    "isindex",
+    "keygen",
+    "link",
+    "menuitem",
+    "meta",
+    "nextid",
+    "param",
+    "source",
+    "spacer",
+    "track",
+    "wbr",
+}
+
+# Attributes that hold a whitespace separated list of values
+LIST_ATTRIBUTES = {"class", "accesskey", "dropzone"}
+
+# Elements with content that is not escaped
+RAW_TEXT_ELEMENTS = {"script", "style"}
+
+# Elements with content that keeps its whitespace
+PREFORMATTED_ELEMENTS = {"pre", "textarea"}
+
 
 def handle_var(value, context):
     """Handle template tag variable."""
@@ -105,13 +162,78 @@ def render_tag(tag, attrs=None, content=None, close=True):
     return format_html(builder, tag=tag, attrs=mark_safe(flatatt(attrs)) if attrs else "", content=text_value(content))
 
 
+def get_cached_template(template_name):
+    """
+    Load a template once and keep it.
+
+    The loaded template is the one that the template loaders find, so overriding templates works as usual.
+    """
+    try:
+        return _templates[template_name]
+    except KeyError:
+        template = _templates[template_name] = get_template(template_name)
+        return template
+
+
+@receiver(setting_changed)
+def reset_cached_templates_on_setting_changed(*, setting, **kwargs):
+    """Discard the cached templates when the template settings change."""
+    if setting in CACHED_TEMPLATE_SETTINGS_DEPENDENCIES:
+        _templates.clear()
+        _overridden_templates.clear()
+
+
+@receiver(file_changed)
+def reset_cached_templates_on_file_changed(**kwargs):
+    """Discard the cached templates when the autoreloader sees a changed file, a template may have been edited."""
+    _templates.clear()
+    _overridden_templates.clear()
+
+
+def is_template_overridden(template_name):
+    """Return whether the template loaders find another template than the one shipped with this package."""
+    try:
+        return _overridden_templates[template_name]
+    except KeyError:
+        origin = getattr(get_cached_template(template_name), "origin", None)
+        overridden = origin is None or origin.name != os.path.join(TEMPLATES_DIR, template_name)
+        _overridden_templates[template_name] = overridden
+        return overridden
+
+
 def render_template_file(template, context=None):
-    """Render a Template to unicode."""
-    assert isinstance(context, Mapping)
-    template = get_template(template)
+    """
+    Render a Template to unicode.
+
+    The context is a dict, or a template Context that keeps its autoescape and localization settings.
+    """
+    assert isinstance(context, Mapping | Context)
+    if template_loaded.receivers:
+        template_loaded.send(sender=None, template_name=template, cached=template in _templates)
+    if template.startswith(CACHED_TEMPLATE_PREFIX):
+        template = get_cached_template(template)
+    else:
+        template = get_template(template)
+    if isinstance(context, Context):
+        return template.template.render(context)
     return template.render(context)
 
 
+def render_field_errors(field_errors):
+    """Render field errors like `bootstrap4/field_errors.html` without going through the template engine."""
+    return (
+        "".join(f'\n    <div class="invalid-feedback">{conditional_escape(text)}</div>\n' for text in field_errors)
+        + "\n"
+    )
+
+
+def render_field_help(field_help):
+    """Render field help like `bootstrap4/field_help_text.html` without going through the template engine."""
+    if field_help:
+        return f'\n    <small class="form-text text-muted">{conditional_escape(field_help)}</small>\n\n'
+    return "\n"
+
+
 def url_replace_param(url, name, value):
     """Replace a GET parameter in an URL."""
     url_components = urlparse(force_str(url))
@@ -137,8 +259,167 @@ def url_replace_param(url, name, value):
     )
 
 
+def url_replace_param_template(url, name):
+    """
+    Return the parts of an URL before and after the value of a GET parameter.
+
+    For a number ``value``, ``prefix + str(value) + suffix`` equals ``url_replace_param(url, name, value)``, so links
+    to many pages of the same URL only parse it once.
+    """
+    url_components = urlparse(force_str(url))
+
+    params = parse_qs(url_components.query)
+    names = list(params)
+    index = names.index(name) if name in params else len(names)
+    params_before = urlencode({key: params[key] for key in names[:index]}, doseq=True)
+    params_after = urlencode({key: params[key] for key in names[index + 1 :]}, doseq=True)
+
+    base_url = urlunparse(
+        [url_components.scheme, url_components.netloc, url_components.path, url_components.params, "", ""]
+    )
+    prefix = f"{base_url}?{params_before}&" if params_before else f"{base_url}?"
+    prefix += f"{quote_plus(force_str(name))}="
+    suffix = f"&{params_after}" if params_after else ""
+    if url_components.fragment:
+        suffix += f"#{url_components.fragment}"
+    return prefix, suffix
+
+
 def sanitize_url_dict(url, url_attr="src"):
     """Sanitize url dict as used in django-bootstrap4 settings."""
     if isinstance(url, str):
         return {url_attr: url}
     return url.copy()
+
+
+def escape_html_text(text):
+    """Escape ampersands and angle brackets."""
+    return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+
+
+def quote_html_attribute(value):
+    """Escape and quote an attribute value, preferring double quotes."""
+    value = escape_html_text(value)
+    if '"' in value:
+        if "'" in value:
+            return '"' + value.replace('"', "&quot;") + '"'
+        return "'" + value + "'"
+    return '"' + value + '"'
+
+
+class ChoiceListClassWriter(HTMLParser):
+    """
+    Add Bootstrap classes to the HTML of a multiple choice widget without building a document tree.
+
+    The first ``div`` gets the CSS classes ``list_class``, every ``div`` inside it gets ``item_class`` and every
+    ``label`` inside it gets ``label_class``. The first ``input`` in such a label gets ``input_class``.
+
+    The output is serialized with sorted attributes and self-closing void elements.
+    """
+
+    def __init__(self, list_class, item_class, label_class="form-check-label", input_class="form-check-input"):
+        super().__init__(convert_charrefs=True)
+        self.list_class = list_class
+        self.item_class = item_class
+        self.label_class = label_class
+        self.input_class = input_class
+        self.output = []
+        # Depth of nested divs in the list div, None before the list div and 0 after it
+        self.list_depth = None
+        # Open labels inside the list div that are still waiting for their first input
+        self.labels = []
+        self.raw_text = False
+        self.preformatted = 0
+        self.text = []
+
+    def in_list(self):
+        return bool(self.list_depth)
+
+    def add_class(self, attrs, css_class, count=1):
+        attrs["class"] = " ".join(attrs.get("class", "").split() + [css_class] * count)
+
+    def flush_text(self):
+        """Write buffered text, whitespace-only text is collapsed to a single newline or space."""
+        if self.text:
+            text = "".join(self.text)
+            self.text = []
+            if not self.preformatted and not text.strip(" \n\t\f\r"):
+                text = "\n" if "\n" in text else " "
+            self.output.append(text if self.raw_text else escape_html_text(text))
+
+    def handle_starttag(self, tag, attrs):
+        self.flush_text()
+        attrs = {name: "" if value is None else value for name, value in attrs}
+        for name in LIST_ATTRIBUTES.intersection(attrs):
+            attrs[name] = " ".join(attrs[name].split())
+        if tag == "div":
+            if self.list_depth is None:
+                attrs["class"] = self.list_class
+                self.list_depth = 1
+            elif self.in_list():
+                self.add_class(attrs, self.item_class)
+                self.list_depth += 1
+        elif tag == "label" and self.in_list():
+            self.add_class(attrs, self.label_class)
+            self.labels.append(True)
+        elif tag == "input" and True in self.labels:
+            self.add_class(attrs, self.input_class, count=self.labels.count(True))
+            self.labels = [False] * len(self.labels)
+        if tag in RAW_TEXT_ELEMENTS:
+            self.raw_text = True
+        elif tag in PREFORMATTED_ELEMENTS:
+            self.preformatted += 1
+        html_attrs = "".join(f" {name}={quote_html_attribute(value)}" for name, value in sorted(attrs.items()))
+        self.output.append(f"<{tag}{html_attrs}{'/' if tag in VOID_ELEMENTS else ''}>")
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+        if tag not in VOID_ELEMENTS:
+            self.handle_endtag(tag)
+
+    def handle_endtag(self, tag):
+        self.flush_text()
+        if tag in VOID_ELEMENTS:
+            return
+        if tag == "div" and self.in_list():
+            # Leaving the list div sets the depth to 0, after that no more classes are added
+            self.list_depth -= 1
+        elif tag == "label" and self.labels:
+            self.labels.pop()
+        if tag in RAW_TEXT_ELEMENTS:
+            self.raw_text = False
+        elif tag in PREFORMATTED_ELEMENTS and self.preformatted:
+            self.preformatted -= 1
+        self.output.append(f"</{tag}>")
+
+    def handle_data(self, data):
+        self.text.append(data)
+
+    def handle_comment(self, data):
+        self.flush_text()
+        self.output.append(f"<!--{data}-->")
+
+    def handle_decl(self, decl):
+        self.flush_text()
+        self.output.append(f"<!{decl}>")
+
+    def unknown_decl(self, data):
+        self.flush_text()
+        self.output.append(f"<![{data}]>")
+
+    def handle_pi(self, data):
+        self.flush_text()
+        self.output.append(f"<?{data}>")
+
+    def rewrite(self, html):
+        self.feed(html)
+        self.close()
+        self.flush_text()
+        return "".join(self.output)
+
+
+def add_choice_list_classes(
+    html, list_class, item_class, label_class="form-check-label", input_class="form-check-input"
+):
+    """Add Bootstrap classes to the HTML of a multiple choice widget, see ``ChoiceListClassWriter``."""
+    return ChoiceListClassWriter(list_class, item_class, label_class=label_class, input_class=input_class).rewrite(html)
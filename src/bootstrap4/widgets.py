@@ -1,11 +1,118 @@
-from django.forms import RadioSelect
-
-
-class RadioSelectButtonGroup(RadioSelect):
-    """
-    Render a Bootstrap 4 set of buttons horizontally instead of typical radio buttons.
-
-    Much more mobile friendly.
-    """
-
-    template_name = "bootstrap4/widgets/radio_select_button_group.html"
+import copy
+import weakref
+from functools import cache
+
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.forms import CheckboxSelectMultiple, RadioSelect, SelectDateWidget
+from django.template import TemplateDoesNotExist
+
+from .utils import add_css_class
+
+# Bootstrap templates for widgets that use the Django templates, keyed by (template_name, option_template_name)
+BOOTSTRAP_WIDGET_TEMPLATES = {
+    (CheckboxSelectMultiple.template_name, CheckboxSelectMultiple.option_template_name): (
+        "bootstrap4/widgets/multiple_input.html",
+        "bootstrap4/widgets/input_option.html",
+    ),
+    (RadioSelect.template_name, RadioSelect.option_template_name): (
+        "bootstrap4/widgets/multiple_input.html",
+        "bootstrap4/widgets/input_option.html",
+    ),
+    (SelectDateWidget.template_name, None): ("bootstrap4/widgets/select_date.html", None),
+}
+
+# Settings that change which templates a form renderer can load
+FORM_RENDERER_SETTINGS_DEPENDENCIES = ("FORM_RENDERER", "TEMPLATES", "INSTALLED_APPS")
+
+# Whether a form renderer can load the templates in BOOTSTRAP_WIDGET_TEMPLATES, keyed by form renderer
+_renderer_has_templates = weakref.WeakKeyDictionary()
+
+
+class RadioSelectButtonGroup(RadioSelect):
+    """
+    Render a Bootstrap 4 set of buttons horizontally instead of typical radio buttons.
+
+    Much more mobile friendly.
+    """
+
+    template_name = "bootstrap4/widgets/radio_select_button_group.html"
+
+
+class BootstrapTemplateMixin:
+    """Render a widget with a Bootstrap template, see ``get_bootstrap_widget``."""
+
+    bootstrap_context = {}
+
+    def get_context(self, name, value, attrs):
+        context = super().get_context(name, value, attrs)
+        context["widget"].update(self.bootstrap_context)
+        return context
+
+    def create_option(self, *args, **kwargs):
+        option = super().create_option(*args, **kwargs)
+        if option["wrap_label"]:
+            option["attrs"]["class"] = add_css_class(option["attrs"].get("class", ""), "form-check-input")
+        return option
+
+
+@cache
+def get_bootstrap_widget_class(widget_class):
+    """Return a subclass of ``widget_class`` that renders with a Bootstrap template."""
+    return type(widget_class.__name__, (BootstrapTemplateMixin, widget_class), {})
+
+
+@receiver(setting_changed)
+def reset_renderer_has_templates(*, setting, **kwargs):
+    """Check the form renderers again when the settings that affect their templates change."""
+    if setting in FORM_RENDERER_SETTINGS_DEPENDENCIES:
+        _renderer_has_templates.clear()
+
+
+def renderer_has_bootstrap_templates(renderer):
+    """
+    Return whether a form renderer can load the Bootstrap widget templates.
+
+    The templates are Django templates in the ``templates`` directory of this app. The Jinja2 form renderer, or a
+    custom ``FORM_RENDERER`` that does not look in app directories, cannot load them.
+    """
+    try:
+        return _renderer_has_templates[renderer]
+    except (KeyError, TypeError):
+        pass
+    template_names = {name for templates in BOOTSTRAP_WIDGET_TEMPLATES.values() for name in templates if name}
+    try:
+        for template_name in template_names:
+            renderer.get_template(template_name)
+    except TemplateDoesNotExist:
+        has_templates = False
+    else:
+        has_templates = True
+    try:
+        _renderer_has_templates[renderer] = has_templates
+    except TypeError:
+        # Renderers that cannot be weakly referenced are checked every time
+        pass
+    return has_templates
+
+
+def get_bootstrap_widget(widget, renderer=None, **context):
+    """
+    Return a copy of ``widget`` that renders Bootstrap markup from a Bootstrap template.
+
+    Return None if there is no Bootstrap template for this widget, or if the form renderer cannot load the Bootstrap
+    templates. Keyword arguments are added to the widget context.
+    """
+    templates = BOOTSTRAP_WIDGET_TEMPLATES.get((widget.template_name, getattr(widget, "option_template_name", None)))
+    if templates is None:
+        return None
+    if renderer is not None and not renderer_has_bootstrap_templates(renderer):
+        return None
+    bootstrap_widget = copy.copy(widget)
+    bootstrap_widget.__class__ = get_bootstrap_widget_class(widget.__class__)
+    template_name, option_template_name = templates
+    bootstrap_widget.template_name = template_name
+    if option_template_name:
+        bootstrap_widget.option_template_name = option_template_name
+    bootstrap_widget.bootstrap_context = context
+    return bootstrap_widget
@@ -13,6 +13,8 @@ INSTALLED_APPS = (
     "django.contrib.messages",
     "django.contrib.staticfiles",
     "django.contrib.gis",
+    # Debug Toolbar for the Bootstrap4Panel tests
+    "debug_toolbar",
     # Our tests
     "bootstrap4",
     "tests",
@@ -20,6 +22,9 @@ INSTALLED_APPS = (
 
 ROOT_URLCONF = "tests.app.urls"
 
+# The Bootstrap4Panel tests drive the toolbar directly, they do not need its middleware
+SILENCED_SYSTEM_CHECKS = ["debug_toolbar.W001"]
+
 MIDDLEWARE = (
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",  # required for django.contrib.admin
@@ -1,6 +1,8 @@
 from django import forms
 from django.contrib.admin.widgets import AdminSplitDateTime
 from django.contrib.gis import forms as gisforms
+from django.forms.renderers import DjangoTemplates
+from django.template import TemplateDoesNotExist
 
 from bootstrap4.widgets import RadioSelectButtonGroup
 
@@ -70,3 +72,12 @@ class TestForm(forms.Form):
 
 class TestFormWithoutRequiredClass(TestForm):
     required_css_class = ""
+
+
+class DjangoWidgetTemplatesRenderer(DjangoTemplates):
+    """Form renderer that only finds the Django widget templates, like a renderer without the app templates."""
+
+    def get_template(self, template_name):
+        if not template_name.startswith("django/forms/"):
+            raise TemplateDoesNotExist(template_name)
+        return super().get_template(template_name)
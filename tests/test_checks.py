@@ -0,0 +1,49 @@
+from django.test import TestCase, override_settings
+
+from bootstrap4.bootstrap import get_field_renderer, get_form_renderer, get_formset_renderer
+from bootstrap4.checks import check_renderers
+from bootstrap4.renderers import FieldRenderer, FormRenderer, FormsetRenderer, InlineFieldRenderer
+
+
+class RendererRegistryTest(TestCase):
+    def test_get_renderers(self):
+        self.assertIs(get_formset_renderer(), FormsetRenderer)
+        self.assertIs(get_form_renderer(layout="horizontal"), FormRenderer)
+        self.assertIs(get_field_renderer(), FieldRenderer)
+        self.assertIs(get_field_renderer(layout="inline"), InlineFieldRenderer)
+
+    def test_get_renderers_after_settings_change(self):
+        self.assertIs(get_field_renderer(layout="inline"), InlineFieldRenderer)
+        with self.settings(BOOTSTRAP4={"field_renderers": {"default": "bootstrap4.renderers.InlineFieldRenderer"}}):
+            self.assertIs(get_field_renderer(), InlineFieldRenderer)
+            self.assertIs(get_field_renderer(layout="inline"), InlineFieldRenderer)
+        self.assertIs(get_field_renderer(), FieldRenderer)
+
+
+class CheckRenderersTest(TestCase):
+    def test_valid_renderers(self):
+        self.assertEqual(check_renderers(), [])
+
+    @override_settings(
+        BOOTSTRAP4={
+            "form_renderers": {"horizontal": "bootstrap4.renderers.FormRenderer"},
+            "field_renderers": {
+                "default": "bootstrap4.renderers.FieldRenderer",
+                "inline": "bootstrap4.renderers.DoesNotExist",
+                "fancy": "bootstrap4.does_not_exist.FieldRenderer",
+            },
+        }
+    )
+    def test_invalid_renderers(self):
+        errors = check_renderers()
+        self.assertEqual([error.id for error in errors], ["bootstrap4.E001", "bootstrap4.E002", "bootstrap4.E002"])
+        self.assertIn("bootstrap4.renderers.DoesNotExist", errors[1].msg)
+        self.assertIn("bootstrap4.does_not_exist.FieldRenderer", errors[2].msg)
+
+    @override_settings(BOOTSTRAP4={"form_renderers": "bootstrap4.renderers.FormRenderer"})
+    def test_renderers_not_a_dict(self):
+        self.assertEqual([error.id for error in check_renderers()], ["bootstrap4.E003"])
+
+    @override_settings(BOOTSTRAP4={"check_renderers": False, "form_renderers": {"default": "does.not.Exist"}})
+    def test_check_renderers_disabled(self):
+        self.assertEqual(check_renderers(), [])
@@ -1,11 +1,20 @@
+from concurrent.futures import ThreadPoolExecutor
+
 from bs4 import BeautifulSoup
+from django import forms
+from django.contrib.auth.models import Group
+from django.core.cache import cache
 from django.forms import formset_factory
 from django.test import TestCase
+from django.utils import translation
 from django.utils.html import escape
 
 from bootstrap4.exceptions import BootstrapError
+from bootstrap4.forms import render_form
+from bootstrap4.renderers import FieldRenderer, FormRenderer, InlineFieldRenderer
+from bootstrap4.widgets import renderer_has_bootstrap_templates
 
-from .forms import CharFieldTestForm, TestForm
+from .forms import CharFieldTestForm, DjangoWidgetTemplatesRenderer, TestForm
 from .utils import render_field, render_form_field, render_template_with_form
 
 
@@ -159,6 +168,29 @@ class FieldTest(TestCase):
         )
         self.assertHTMLEqual(res, expected_html)
 
+    def test_checkbox_multiple_select_size(self):
+        res = render_template_with_form('{% bootstrap_field form.category2 size="sm" form_check_class="my-check" %}')
+        self.assertIn('<div class="checkbox form-control-sm" id="id_category2">', res)
+        self.assertIn('<div class="my-check">', res)
+        self.assertNotIn('class="form-check"', res)
+
+    def test_radio_select_button_group(self):
+        """RadioSelectButtonGroup has its own template and gets the Bootstrap classes after rendering."""
+        res = render_form_field("category5")
+        self.assertIn('<div class="radio radio-success" data-toggle="buttons" id="id_category5">', res)
+        self.assertIn('<label class="btn btn-outline-primary form-check-label" id="id_category5">', res)
+        self.assertIn('class="form-check-input"', res)
+
+    def test_select_date_widget(self):
+        class SelectDateForm(forms.Form):
+            date = forms.DateField(widget=forms.SelectDateWidget(years=[2020]))
+
+        res = render_template_with_form("{% bootstrap_field form.date %}", {"form": SelectDateForm()})
+        self.assertIn('<div class="row bootstrap4-multi-input"><div class="col-4"><select name="date_month"', res)
+        self.assertIn('</select></div><div class="col-4"><select name="date_day"', res)
+        self.assertIn('<option value="2020">2020</option></select></div></div>', res)
+        self.assertEqual(res.count('<div class="col-4">'), 3)
+
     def test_required_field(self):
         required_css_class = "bootstrap4-req"
         required_field = render_form_field("subject")
@@ -283,6 +315,225 @@ class FieldTest(TestCase):
         self.assertEqual(attrs, form.fields["addon"].widget.attrs)
 
 
+class WidgetTemplateFallbackTest(TestCase):
+    def test_renderer_without_bootstrap_templates(self):
+        form = TestForm(renderer=DjangoWidgetTemplatesRenderer())
+        self.assertFalse(renderer_has_bootstrap_templates(form.renderer))
+        renderer = FieldRenderer(form["category1"])
+        res = renderer.render()
+        self.assertTrue(renderer.list_to_class_applied)
+        self.assertIn('<div class="radio radio-success" id="id_category1">', res)
+        self.assertIn('class="form-check-input"', res)
+
+        class DateForm(forms.Form):
+            date = forms.DateField(widget=forms.SelectDateWidget)
+
+        date_form = DateForm(renderer=DjangoWidgetTemplatesRenderer())
+        self.assertIn('<div class="col-4"><select', FieldRenderer(date_form["date"]).render())
+
+    def test_renderer_with_bootstrap_templates(self):
+        form = TestForm()
+        self.assertTrue(renderer_has_bootstrap_templates(form.renderer))
+        renderer = FieldRenderer(form["category1"])
+        renderer.render()
+        self.assertFalse(renderer.list_to_class_applied)
+
+
+class LabelClassTest(TestCase):
+    def test_label_class_per_field(self):
+        class RequiredLabelFieldRenderer(FieldRenderer):
+            def get_label_class(self):
+                label_class = super().get_label_class()
+                return f"{label_class} req".strip() if self.field.field.required else label_class
+
+        form = TestForm()
+        self.assertIn('<label class="req" for="id_subject">', RequiredLabelFieldRenderer(form["subject"]).render())
+        self.assertNotIn("req", RequiredLabelFieldRenderer(form["message"]).render())
+
+
+class WidgetAttrsTest(TestCase):
+    def test_widget_attrs_not_changed(self):
+        form = TestForm()
+        widget = form.fields["subject"].widget
+        attrs = widget.attrs.copy()
+        FieldRenderer(form["subject"], placeholder="placeholder").render()
+        self.assertEqual(widget.attrs, attrs)
+
+    def test_addon_attrs_not_changed(self):
+        form = TestForm()
+        widget = form.fields["addon"].widget
+        attrs = widget.attrs.copy()
+        res = FieldRenderer(form["addon"]).render()
+        self.assertIn('<span class="input-group-text">before</span>', res)
+        self.assertNotIn("addon_before=", res)
+        self.assertEqual(widget.attrs, attrs)
+
+    def test_multi_widget_attrs_not_changed(self):
+        form = TestForm()
+        widgets = form.fields["datetime"].widget.widgets
+        attrs = [widget.attrs.copy() for widget in widgets]
+        res = InlineFieldRenderer(form["datetime"], size="sm").render()
+        self.assertEqual(res.count("form-control-sm"), 2)
+        self.assertEqual([widget.attrs for widget in widgets], attrs)
+        self.assertNotIn("form-control-sm", FieldRenderer(form["datetime"], placeholder="ph").render())
+
+
+class ConcurrentRenderTest(TestCase):
+    def test_render_shared_form_from_threads(self):
+        unbound_form = TestForm()
+        bound_form = TestForm(data={"subject": "subject", "sender": "invalid"})
+        bound_form.is_valid()
+        tasks = [
+            (form, kwargs)
+            for form in (unbound_form, bound_form)
+            for kwargs in (
+                {},
+                {"layout": "horizontal"},
+                {"layout": "inline", "size": "sm"},
+                {"size": "lg", "set_placeholder": False},
+            )
+        ]
+        expected = [render_form(form, **kwargs) for form, kwargs in tasks] * 25
+        widget_attrs = {name: field.widget.attrs.copy() for name, field in unbound_form.fields.items()}
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(lambda task: render_form(task[0], **task[1]), tasks * 25))
+
+        self.assertEqual(results, expected)
+        self.assertEqual({name: field.widget.attrs for name, field in unbound_form.fields.items()}, widget_attrs)
+
+
+class FormCacheTest(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_cache_unbound_form(self):
+        form = TestForm(initial={"subject": "initial"})
+        res = render_form(form, cache=True, layout="horizontal")
+        self.assertEqual(res, render_form(form, layout="horizontal"))
+        cache_key = FormRenderer(form, cache=True, layout="horizontal").get_cache_key()
+        self.assertEqual(cache.get(cache_key), res)
+        cache.set(cache_key, "cached")
+        self.assertEqual(render_form(form, cache=True, layout="horizontal"), "cached")
+        self.assertEqual("".join(FormRenderer(form, cache=True, layout="horizontal").iter_render()), "cached")
+
+    def test_cache_key(self):
+        cache_key = FormRenderer(TestForm(), cache=True).get_cache_key()
+        self.assertEqual(FormRenderer(TestForm(), cache=True).get_cache_key(), cache_key)
+        self.assertIsNone(FormRenderer(TestForm()).get_cache_key())
+        self.assertNotEqual(FormRenderer(TestForm(), cache=True, size="sm").get_cache_key(), cache_key)
+        self.assertNotEqual(FormRenderer(TestForm(), cache=True, cache_version=2).get_cache_key(), cache_key)
+        self.assertNotEqual(FormRenderer(TestForm(prefix="other"), cache=True).get_cache_key(), cache_key)
+        self.assertNotEqual(
+            FormRenderer(TestForm(initial={"subject": "initial"}), cache=True).get_cache_key(), cache_key
+        )
+        with translation.override("nl"):
+            self.assertNotEqual(FormRenderer(TestForm(), cache=True).get_cache_key(), cache_key)
+
+    def test_cache_key_choices_set_in_init(self):
+        class FilterForm(forms.Form):
+            project = forms.ChoiceField(choices=[])
+
+            def __init__(self, *args, projects=(), **kwargs):
+                super().__init__(*args, **kwargs)
+                self.fields["project"].choices = projects
+
+        res = render_form(FilterForm(projects=[("1", "Alice secret project")]), cache=True)
+        self.assertIn("Alice secret project", res)
+        res = render_form(FilterForm(projects=[("2", "Bob project")]), cache=True)
+        self.assertIn("Bob project", res)
+        self.assertNotIn("Alice secret project", res)
+
+    def test_cache_key_fields_changed_in_init(self):
+        cache_key = FormRenderer(TestForm(), cache=True).get_cache_key()
+        for attribute, value in [("label", "Other label"), ("help_text", "Other help"), ("required", False)]:
+            form = TestForm()
+            setattr(form.fields["subject"], attribute, value)
+            self.assertNotEqual(FormRenderer(form, cache=True).get_cache_key(), cache_key)
+        form = TestForm()
+        form.fields["subject"].widget.attrs["data-user"] = "1"
+        self.assertNotEqual(FormRenderer(form, cache=True).get_cache_key(), cache_key)
+
+    def test_cache_key_queryset(self):
+        class GroupForm(forms.Form):
+            group = forms.ModelChoiceField(queryset=Group.objects.none())
+
+        keys = set()
+        for queryset in [Group.objects.filter(name="a"), Group.objects.filter(name="b"), Group.objects.none()]:
+            form = GroupForm()
+            form.fields["group"].queryset = queryset
+            keys.add(FormRenderer(form, cache=True).get_cache_key())
+        self.assertEqual(len(keys), 3)
+
+    def test_no_cache_bound_form(self):
+        form = TestForm(data={"subject": "subject"})
+        self.assertIsNone(FormRenderer(form, cache=True).get_cache_key())
+
+    def test_no_cache_callable_initial(self):
+        form = TestForm(initial={"subject": lambda: "initial"})
+        self.assertIsNone(FormRenderer(form, cache=True).get_cache_key())
+        self.assertIn('value="initial"', render_form(form, cache=True))
+
+
+class FieldCacheTest(TestCase):
+    class ChoiceForm(forms.Form):
+        choice = forms.ChoiceField(choices=[(str(i), f"Choice {i}") for i in range(100)], help_text="Pick one")
+
+    def setUp(self):
+        cache.clear()
+
+    def get_cache_key(self, field, **kwargs):
+        renderer = FieldRenderer(field, cache=True, **kwargs)
+        return renderer.get_widget_cache_key(*renderer.add_widget_attrs())
+
+    def test_cache_widget(self):
+        form = self.ChoiceForm(initial={"choice": "3"})
+        res = FieldRenderer(form["choice"], cache=True).render()
+        self.assertEqual(res, FieldRenderer(form["choice"]).render())
+        cache_key = self.get_cache_key(form["choice"])
+        self.assertIn('<option value="3" selected>Choice 3</option>', cache.get(cache_key))
+        cache.set(cache_key, "<cached>")
+        res = FieldRenderer(form["choice"], cache=True).render()
+        self.assertIn("<cached>", res)
+        self.assertIn("Pick one", res)
+
+    def test_cache_key(self):
+        form = self.ChoiceForm()
+        cache_key = self.get_cache_key(form["choice"])
+        self.assertEqual(self.get_cache_key(self.ChoiceForm()["choice"]), cache_key)
+        self.assertIsNone(FieldRenderer(form["choice"]).get_widget_cache_key({}))
+        self.assertNotEqual(self.get_cache_key(form["choice"], cache_version=2), cache_key)
+        self.assertNotEqual(self.get_cache_key(form["choice"], size="lg"), cache_key)
+        self.assertNotEqual(self.get_cache_key(self.ChoiceForm(initial={"choice": "1"})["choice"]), cache_key)
+        self.assertNotEqual(self.get_cache_key(self.ChoiceForm(data={})["choice"]), cache_key)
+
+    def test_cache_key_label_and_choices(self):
+        class AgreeForm(forms.Form):
+            agree = forms.BooleanField(label="Agree to A")
+
+        res = FieldRenderer(AgreeForm()["agree"], cache=True).render()
+        self.assertIn("Agree to A", res)
+        form = AgreeForm()
+        form.fields["agree"].label = "Accept terms B"
+        res = FieldRenderer(form["agree"], cache=True).render()
+        self.assertIn("Accept terms B", res)
+        self.assertNotIn("Agree to A", res)
+
+        form = self.ChoiceForm()
+        form.fields["choice"].choices = [("1", "Other choice")]
+        self.assertNotEqual(self.get_cache_key(form["choice"]), self.get_cache_key(self.ChoiceForm()["choice"]))
+
+    def test_cache_key_show_help(self):
+        class AgreeForm(forms.Form):
+            agree = forms.BooleanField(help_text="Secret help")
+
+        res = FieldRenderer(AgreeForm()["agree"], cache=True, show_help=True).render()
+        self.assertIn('title="Secret help"', res)
+        res = FieldRenderer(AgreeForm()["agree"], cache=True, show_help=False).render()
+        self.assertNotIn("Secret help", res)
+        self.assertEqual(res, FieldRenderer(AgreeForm()["agree"], show_help=False).render())
+
+
 class ComponentsTest(TestCase):
     def test_bootstrap_alert(self):
         res = render_template_with_form('{% bootstrap_alert "content" alert_type="danger" %}')
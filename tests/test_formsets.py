@@ -1,6 +1,14 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
 from bs4 import BeautifulSoup
+from django.forms import formset_factory
+from django.http import StreamingHttpResponse
 from django.test import TestCase
+from django.utils import translation
 
+from bootstrap4 import forms as bootstrap4_forms
 from bootstrap4.exceptions import BootstrapError
 
 from .forms import TestForm
@@ -13,6 +21,105 @@ class BootstrapFormSetTest(TestCase):
             render_formset(formset="illegal")
 
 
+class IterRenderTest(TestCase):
+    def test_iter_render_formset(self):
+        TestFormSet = formset_factory(TestForm, extra=3)
+        formset = TestFormSet(data={"form-TOTAL_FORMS": "3", "form-INITIAL_FORMS": "0"})
+        chunks = list(bootstrap4_forms.iter_render_formset(formset, layout="horizontal"))
+        # Errors and management form, followed by one chunk per form
+        self.assertEqual(len(chunks), 4)
+        self.assertEqual("".join(chunks), bootstrap4_forms.render_formset(formset, layout="horizontal"))
+
+    def test_iter_render_form(self):
+        form = TestForm(data={"subject": "subject"})
+        chunks = list(bootstrap4_forms.iter_render_form(form, alert_error_type="all"))
+        self.assertEqual(len(chunks), len(form.fields) + 1)
+        self.assertEqual("".join(chunks), bootstrap4_forms.render_form(form, alert_error_type="all"))
+
+    def test_streaming_response(self):
+        TestFormSet = formset_factory(TestForm, extra=2)
+        formset = TestFormSet()
+        response = StreamingHttpResponse(bootstrap4_forms.iter_render_formset(formset))
+        self.assertEqual(b"".join(response.streaming_content).decode(), bootstrap4_forms.render_formset(formset))
+
+
+class AsyncRenderTest(TestCase):
+    async def test_arender_formset(self):
+        TestFormSet = formset_factory(TestForm, extra=3)
+        formset = TestFormSet(data={"form-TOTAL_FORMS": "3", "form-INITIAL_FORMS": "0"})
+        res = await bootstrap4_forms.arender_formset(formset, layout="horizontal")
+        self.assertEqual(res, bootstrap4_forms.render_formset(formset, layout="horizontal"))
+
+    async def test_arender_form(self):
+        form = TestForm(data={"subject": "subject"})
+        res = await bootstrap4_forms.arender_form(form, alert_error_type="all")
+        self.assertEqual(res, bootstrap4_forms.render_form(form, alert_error_type="all"))
+
+    async def test_arender_field(self):
+        form = TestForm()
+        res = await bootstrap4_forms.arender_field(form["subject"], size="sm")
+        self.assertEqual(res, bootstrap4_forms.render_field(form["subject"], size="sm"))
+
+    async def test_arender_form_yields_to_event_loop(self):
+        ticks = 0
+
+        async def tick():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0)
+
+        form = TestForm()
+        task = asyncio.create_task(tick())
+        await bootstrap4_forms.arender_form(form)
+        task.cancel()
+        # At least once per field
+        self.assertGreaterEqual(ticks, len(form.fields))
+
+
+class FormsetExecutorTest(TestCase):
+    def get_formset(self, total_forms):
+        TestFormSet = formset_factory(TestForm, extra=total_forms)
+        return TestFormSet(data={"form-TOTAL_FORMS": str(total_forms), "form-INITIAL_FORMS": "0"})
+
+    def test_render_formset_with_executor(self):
+        formset = self.get_formset(7)
+        with translation.override("nl"), ThreadPoolExecutor(max_workers=3) as executor:
+            expected = bootstrap4_forms.render_formset(formset)
+            res = bootstrap4_forms.render_formset(
+                formset, executor=executor, executor_threshold=1, executor_chunk_size=2
+            )
+        self.assertEqual(res, expected)
+        self.assertIn("Dit veld is verplicht.", res)
+
+    def test_executor_threshold(self):
+        class SerialExecutor:
+            def map(self, *args):
+                raise AssertionError("Formset below threshold should not use the executor.")
+
+        formset = self.get_formset(3)
+        res = bootstrap4_forms.render_formset(formset, executor=SerialExecutor(), executor_threshold=4)
+        self.assertEqual(res, bootstrap4_forms.render_formset(formset))
+
+    def test_close_connections_in_worker_threads(self):
+        class CallingThreadExecutor:
+            def map(self, func, *iterables):
+                return map(func, *iterables)
+
+        formset = self.get_formset(4)
+        with mock.patch("bootstrap4.renderers.close_old_connections") as close_old_connections:
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                bootstrap4_forms.render_formset(formset, executor=executor, executor_chunk_size=2)
+            self.assertEqual(close_old_connections.call_count, 2)
+            close_old_connections.reset_mock()
+            bootstrap4_forms.render_formset(formset, executor=CallingThreadExecutor(), executor_chunk_size=2)
+            close_old_connections.assert_not_called()
+
+    def test_illegal_executor_chunk_size(self):
+        with self.assertRaises(BootstrapError):
+            bootstrap4_forms.render_formset(self.get_formset(1), executor_chunk_size=0)
+
+
 class BootstrapFormTest(TestCase):
     def test_illegal_form(self):
         with self.assertRaises(BootstrapError):
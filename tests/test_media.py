@@ -1,6 +1,7 @@
 from django.test import TestCase, override_settings
 
 from bootstrap4.bootstrap import get_bootstrap_setting
+from bootstrap4.templatetags.bootstrap4 import bootstrap_css, bootstrap_javascript, bootstrap_jquery
 
 from .forms import TestForm
 from .utils import render_template_with_form
@@ -85,3 +86,20 @@ class JavaScriptTagTest(TestCase):
         res = render_template_with_form("{% bootstrap_javascript jquery=True %}")
         self.assertIn("bootstrap", res)
         self.assertIn("jquery", res)
+
+
+class AssetHtmlTest(TestCase):
+    def test_asset_html_is_reused(self):
+        self.assertIs(bootstrap_css(), bootstrap_css())
+        self.assertIs(bootstrap_javascript(jquery="slim"), bootstrap_javascript(jquery="slim"))
+        self.assertIs(bootstrap_jquery(jquery="full"), bootstrap_jquery(jquery=True))
+        self.assertNotEqual(bootstrap_jquery(jquery="slim"), bootstrap_jquery(jquery=True))
+        self.assertEqual(bootstrap_jquery(jquery=False), "")
+
+    def test_asset_html_follows_settings(self):
+        self.assertIn("bootstrap.min.css", bootstrap_css())
+        with override_settings(BOOTSTRAP4={"css_url": "https://example.com/custom.css", "include_jquery": True}):
+            self.assertIn("https://example.com/custom.css", bootstrap_css())
+            self.assertIn("jquery", bootstrap_javascript())
+        self.assertIn("bootstrap.min.css", bootstrap_css())
+        self.assertNotIn("jquery", bootstrap_javascript())
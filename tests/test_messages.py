@@ -1,7 +1,14 @@
 import re
+import tempfile
+from pathlib import Path
 
 from django.contrib.messages import constants as DEFAULT_MESSAGE_LEVELS
-from django.test import TestCase
+from django.contrib.messages.storage.base import Message
+from django.test import TestCase, override_settings
+from django.utils.safestring import mark_safe
+
+from bootstrap4.templatetags.bootstrap4 import render_messages
+from bootstrap4.utils import render_template_file
 
 from .utils import render_template_with_form
 
@@ -80,3 +87,33 @@ class MessagesTest(TestCase):
     </div>
         """
         self.assertEqual(re.sub(pattern, "", res), re.sub(pattern, "", expected))
+
+    def test_render_messages(self):
+        messages = [
+            Message(DEFAULT_MESSAGE_LEVELS.INFO, "<b>hello</b>", extra_tags="extra"),
+            Message(DEFAULT_MESSAGE_LEVELS.ERROR, mark_safe("<b>safe</b>")),
+        ]
+        for value in [None, [], messages]:
+            self.assertEqual(
+                render_messages(value),
+                render_template_file(
+                    "bootstrap4/messages.html", context={"messages": value, "message_constants": DEFAULT_MESSAGE_LEVELS}
+                ),
+            )
+
+    def test_bootstrap_messages_overridden_template(self):
+        with tempfile.TemporaryDirectory() as templates_dir:
+            (Path(templates_dir) / "bootstrap4").mkdir()
+            (Path(templates_dir) / "bootstrap4" / "messages.html").write_text("{{ title }}: {{ messages|length }}")
+            templates = [
+                {
+                    "BACKEND": "django.template.backends.django.DjangoTemplates",
+                    "DIRS": [templates_dir],
+                    "APP_DIRS": True,
+                }
+            ]
+            with override_settings(TEMPLATES=templates):
+                res = render_template_with_form(
+                    "{% bootstrap_messages %}", {"messages": [Message(DEFAULT_MESSAGE_LEVELS.INFO, "a")], "title": "T"}
+                )
+        self.assertEqual(res.strip(), "T: 1")
@@ -1,7 +1,14 @@
-from django.core.paginator import Paginator
-from django.test import TestCase
+from django.core.paginator import EmptyPage, PageNotAnInteger, Paginator
+from django.test import TestCase, override_settings
 
-from bootstrap4.utils import url_replace_param
+from bootstrap4.paginator import CountlessPaginator
+from bootstrap4.templatetags.bootstrap4 import (
+    get_cached_pagination_context,
+    get_cursor_pagination_context,
+    get_pagination_context,
+    render_cached_pagination,
+)
+from bootstrap4.utils import url_replace_param, url_replace_param_template
 
 from .utils import render_template
 
@@ -12,6 +19,23 @@ class PaginatorTest(TestCase):
         self.assertEqual(url_replace_param("/foo/bar?baz=foo", "baz", None), "/foo/bar")
         self.assertEqual(url_replace_param("/foo/bar#id", "baz", "foo"), "/foo/bar?baz=foo#id")
 
+    def test_url_replace_param_template(self):
+        for url in ["", "/foo/bar?baz=foo", "/foo/bar?a=1&baz=foo&b=2&b=3", "http://example.com/foo;x?a=%26#id"]:
+            prefix, suffix = url_replace_param_template(url, "baz")
+            self.assertEqual(f"{prefix}12{suffix}", url_replace_param(url, "baz", 12))
+
+    def test_pagination_context_urls(self):
+        paginator = Paginator(range(100), 1)
+        context = get_pagination_context(paginator.page(50), url="/projects/?page=3&foo=bar#id", pages_to_show=5)
+        self.assertEqual(context["first_url"], "/projects/?page=1&foo=bar#id")
+        self.assertEqual(context["last_url"], "/projects/?page=100&foo=bar#id")
+        self.assertEqual(context["pages_back_url"], "/projects/?page=46&foo=bar#id")
+        self.assertEqual(context["pages_forward_url"], "/projects/?page=54&foo=bar#id")
+        self.assertEqual(
+            context["pages_shown_urls"],
+            [(number, f"/projects/?page={number}&foo=bar#id") for number in context["pages_shown"]],
+        )
+
     def bootstrap_pagination(self, page, extra=""):
         """Render bootstrap_pagination tag."""
         template = """
@@ -39,3 +63,145 @@ class PaginatorTest(TestCase):
 
         res = self.bootstrap_pagination(p.page(2), extra='url="/projects/?page=3" extra="id=20"')
         self.assertTrue("/projects/?page=1&id=20" in res or "/projects/?id=20&page=1" in res)
+
+
+class CountlessPaginationTest(TestCase):
+    def test_countless_paginator(self):
+        context = get_pagination_context(CountlessPaginator(range(100), 1).page(50), url="/items/", pages_to_show=5)
+        self.assertIsNone(context["num_pages"])
+        self.assertEqual(context["pages_shown"], [48, 49, 50, 51])
+        self.assertEqual(context["pages_back"], 46)
+        self.assertIsNone(context["pages_forward"])
+        self.assertEqual(context["last_url"], "/items/?page=51")
+
+    def test_countless_last_page(self):
+        context = get_pagination_context(CountlessPaginator(range(100), 1).page(100), pages_to_show=5)
+        self.assertEqual(context["pages_shown"], [98, 99, 100])
+        self.assertIsNone(context["last_url"])
+        res = render_template(
+            "{% load bootstrap4 %}{% bootstrap_pagination page %}",
+            {"page": CountlessPaginator(range(100), 1).page(100)},
+        )
+        self.assertIn('<li class="last page-item disabled">', res)
+        self.assertIn("?page=99", res)
+
+    def test_countless_paginator_does_not_count(self):
+        class UncountableList(list):
+            def count(self):
+                raise AssertionError("CountlessPaginator should not count the objects.")
+
+            def __len__(self):
+                raise AssertionError("CountlessPaginator should not count the objects.")
+
+        paginator = CountlessPaginator(UncountableList(range(25)), 10)
+        page = paginator.page(2)
+        self.assertEqual(list(page), list(range(10, 20)))
+        self.assertTrue(page.has_next())
+        self.assertTrue(page.has_previous())
+        self.assertEqual((page.next_page_number(), page.previous_page_number()), (3, 1))
+        self.assertEqual((page.start_index(), page.end_index()), (11, 20))
+        self.assertEqual(get_pagination_context(page)["pages_shown"], [1, 2, 3])
+        last_page = paginator.page(3)
+        self.assertFalse(last_page.has_next())
+        self.assertEqual((last_page.start_index(), last_page.end_index()), (21, 25))
+        with self.assertRaises(EmptyPage):
+            last_page.next_page_number()
+
+    def test_countless_paginator_invalid_pages(self):
+        paginator = CountlessPaginator(range(25), 10)
+        with self.assertRaises(PageNotAnInteger):
+            paginator.page("x")
+        with self.assertRaises(EmptyPage):
+            paginator.page(0)
+        with self.assertRaises(EmptyPage):
+            paginator.page(4)
+        self.assertEqual(paginator.get_page(4).number, 1)
+        self.assertEqual(CountlessPaginator([], 10).page(1).start_index(), 0)
+
+    def test_countless_paginator_page_range(self):
+        paginator = CountlessPaginator(range(25), 10)
+        with self.assertRaises(NotImplementedError):
+            paginator.page_range
+        with self.assertRaises(NotImplementedError):
+            paginator.get_elided_page_range(2)
+        self.assertEqual(paginator.count, 25)
+
+    def test_count_false(self):
+        paginator = Paginator(range(100), 1)
+        context = get_pagination_context(paginator.page(1), pages_to_show=5, count=False)
+        self.assertIsNone(context["num_pages"])
+        self.assertEqual(context["pages_shown"], [1, 2])
+        self.assertEqual(context["last_url"], "?page=2")
+
+
+class CursorPaginationTest(TestCase):
+    def test_cursor_pagination_context(self):
+        context = get_cursor_pagination_context(
+            next_cursor="cD0yMDI0+/=", url="/items/?cursor=abc&sort=name#top", size="small", justify_content="end"
+        )
+        self.assertEqual(context["next_url"], "/items/?cursor=cD0yMDI0%2B%2F%3D&sort=name#top")
+        self.assertIsNone(context["previous_url"])
+        self.assertEqual(context["pagination_css_classes"], "pagination pagination-sm justify-content-end")
+
+    def test_bootstrap_cursor_pagination(self):
+        res = render_template(
+            '{% load bootstrap4 %}{% bootstrap_cursor_pagination next_cursor="n1" previous_cursor="p1" extra="q=x" %}'
+        )
+        self.assertIn('href="?q=x&cursor=p1"', res)
+        self.assertIn('href="?q=x&cursor=n1"', res)
+        self.assertNotIn("disabled", res)
+
+        res = render_template(
+            "{% load bootstrap4 %}{% bootstrap_cursor_pagination previous_cursor=cursor %}", {"cursor": "p1"}
+        )
+        self.assertIn('<li class="next page-item disabled">', res)
+
+
+class PaginationCacheTest(TestCase):
+    def setUp(self):
+        get_cached_pagination_context.cache_clear()
+        render_cached_pagination.cache_clear()
+
+    def test_context_cache(self):
+        paginator = Paginator(range(100), 1)
+        context = get_pagination_context(paginator.page(50), url="/items/")
+        context["pages_shown"].append(1000)
+        self.assertEqual(get_pagination_context(paginator.page(50), url="/items/")["pages_shown"], list(range(45, 56)))
+        get_pagination_context(paginator.page(51), url="/items/")
+        cache_info = get_cached_pagination_context.cache_info()
+        self.assertEqual((cache_info.hits, cache_info.misses), (1, 2))
+
+    def test_rendered_pagination_cache(self):
+        paginator = Paginator(range(100), 1)
+        template = '{% load bootstrap4 %}{% bootstrap_pagination page url="/items/" %}'
+        res = render_template(template, {"page": paginator.page(50)})
+        self.assertEqual(render_template(template, {"page": paginator.page(50)}), res)
+        cache_info = render_cached_pagination.cache_info()
+        self.assertEqual((cache_info.hits, cache_info.misses), (1, 1))
+        with override_settings(USE_THOUSAND_SEPARATOR=True):
+            self.assertEqual(render_cached_pagination.cache_info().currsize, 0)
+
+    @override_settings(USE_THOUSAND_SEPARATOR=True)
+    def test_rendered_pagination_template_context(self):
+        paginator = Paginator(range(2000), 1)
+        localize_off = (
+            "{% load bootstrap4 l10n %}{% localize off %}{% bootstrap_pagination page extra=extra %}{% endlocalize %}"
+        )
+        unhashable_str = type("UnhashableStr", (str,), {"__hash__": None})
+        for extra in ["q=x", unhashable_str("q=x")]:
+            with self.subTest(extra=extra):
+                res = render_template(localize_off, {"page": paginator.page(1495), "extra": extra})
+                self.assertIn("1495", res)
+                self.assertNotIn("1,495", res)
+                res = render_template(
+                    "{% load bootstrap4 %}{% bootstrap_pagination page extra=extra %}",
+                    {"page": paginator.page(1495), "extra": extra},
+                )
+                self.assertIn("1,495", res)
+
+    def test_unhashable_parameters(self):
+        paginator = Paginator(range(100), 1)
+        unhashable_str = type("UnhashableStr", (str,), {"__hash__": None})
+        context = get_pagination_context(paginator.page(50), extra=unhashable_str("q=x"))
+        self.assertEqual(context["first_url"], "?q=x&page=1")
+        self.assertEqual(get_cached_pagination_context.cache_info().currsize, 0)
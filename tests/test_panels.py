@@ -0,0 +1,55 @@
+from debug_toolbar.toolbar import DebugToolbar
+from django import forms
+from django.http import HttpResponse
+from django.template import Context, Template
+from django.test import RequestFactory, TestCase, override_settings
+
+from .forms import DjangoWidgetTemplatesRenderer
+
+
+class PanelForm(forms.Form):
+    subject = forms.CharField()
+    color = forms.ChoiceField(choices=[("red", "Red"), ("green", "Green")], widget=forms.RadioSelect)
+
+    def clean(self):
+        raise forms.ValidationError("This is a non field error.")
+
+
+def view(request):
+    template = Template("{% load bootstrap4 %}{% bootstrap_css %}{% bootstrap_form form %}")
+    form = PanelForm(data={}, renderer=DjangoWidgetTemplatesRenderer())
+    return HttpResponse(template.render(Context({"form": form})))
+
+
+@override_settings(DEBUG_TOOLBAR_PANELS=["bootstrap4.panels.Bootstrap4Panel"])
+class Bootstrap4PanelTest(TestCase):
+    def get_panel(self):
+        """Run the view through the toolbar like DebugToolbarMiddleware does, and return the Bootstrap4Panel."""
+        request = RequestFactory().get("/")
+        toolbar = DebugToolbar(request, view)
+        for panel in toolbar.enabled_panels:
+            panel.enable_instrumentation()
+        try:
+            response = toolbar.process_request(request)
+        finally:
+            for panel in reversed(toolbar.enabled_panels):
+                panel.disable_instrumentation()
+        for panel in reversed(toolbar.enabled_panels):
+            panel.generate_stats(request, response)
+        return toolbar.get_panel_by_id("Bootstrap4Panel")
+
+    def test_panel_stats(self):
+        panel = self.get_panel()
+        stats = panel.get_stats()
+        self.assertEqual([tag["name"] for tag in stats["tags"]], ["bootstrap_css", "bootstrap_form"])
+        self.assertEqual(stats["total_time"], sum(tag["time"] for tag in stats["tags"]))
+        self.assertEqual(stats["template_loads"], 1)
+        self.assertGreater(stats["setting_reads"], 0)
+        self.assertEqual(stats["list_to_class_parses"], 1)
+        self.assertTrue(panel.nav_subtitle.startswith("2 tags in "))
+        self.assertIn("list_to_class", panel.content)
+
+    def test_panel_disconnects_signals(self):
+        self.get_panel()
+        panel = self.get_panel()
+        self.assertEqual(len(panel.get_stats()["tags"]), 2)
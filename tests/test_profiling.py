@@ -0,0 +1,47 @@
+from django.test import TestCase
+
+from bootstrap4.forms import render_form
+from bootstrap4.profiling import STAGES, profile_rendering
+from bootstrap4.renderers import FieldRenderer, InlineFieldRenderer
+
+from .forms import TestForm
+
+
+class ProfileRenderingTest(TestCase):
+    def test_profile_rendering(self):
+        add_widget_attrs = FieldRenderer.add_widget_attrs
+        inline_add_widget_attrs = InlineFieldRenderer.add_widget_attrs
+        form = TestForm(data={})
+        with profile_rendering() as profile:
+            render_form(form, layout="inline")
+        self.assertIs(FieldRenderer.add_widget_attrs, add_widget_attrs)
+        self.assertIs(InlineFieldRenderer.add_widget_attrs, inline_add_widget_attrs)
+
+        data = profile.as_dict()
+        self.assertEqual(data["fields"], len(form.fields))
+        visible_fields = len(form.visible_fields())
+        # InlineFieldRenderer.add_widget_attrs calls super(), that is not counted twice
+        self.assertEqual(data["stages"]["add_widget_attrs"]["calls"], visible_fields)
+        self.assertEqual(data["stages"]["render_widget"]["calls"], visible_fields)
+        self.assertLessEqual(sum(stage["time"] for stage in data["stages"].values()), data["total"])
+        self.assertLessEqual(set(data["stages"]), set(STAGES))
+        self.assertIn("render_widget", profile.report())
+
+    def test_profile_rendering_decorator(self):
+        profiles = []
+
+        @profile_rendering(callback=profiles.append)
+        def render():
+            return render_form(TestForm())
+
+        render()
+        render()
+        self.assertEqual(len(profiles), 2)
+        self.assertIsNot(profiles[0], profiles[1])
+        self.assertEqual(profiles[0].fields, profiles[1].fields)
+
+    def test_no_profile(self):
+        with profile_rendering() as profile:
+            pass
+        render_form(TestForm())
+        self.assertEqual(profile.as_dict(), {"fields": 0, "total": 0.0, "stages": {}, "other": 0.0})
@@ -1,6 +1,12 @@
 from django.test import TestCase, override_settings
 
-from bootstrap4.bootstrap import get_bootstrap_setting, include_jquery, jquery_slim_url, jquery_url
+from bootstrap4.bootstrap import (
+    get_bootstrap_setting,
+    get_bootstrap_settings,
+    include_jquery,
+    jquery_slim_url,
+    jquery_url,
+)
 
 
 class SettingsTest(TestCase):
@@ -11,6 +17,21 @@ class SettingsTest(TestCase):
         with self.settings(BOOTSTRAP4={"SETTING_DOES_NOT_EXIST": "exists now"}):
             self.assertEqual(get_bootstrap_setting("SETTING_DOES_NOT_EXIST"), "exists now")
 
+    def test_get_bootstrap_settings_is_cached(self):
+        self.assertIs(get_bootstrap_settings(), get_bootstrap_settings())
+        with self.assertRaises(TypeError):
+            get_bootstrap_settings()["set_placeholder"] = False
+
+    def test_get_bootstrap_settings_invalidation(self):
+        bootstrap_settings = get_bootstrap_settings()
+        with self.settings(BOOTSTRAP4={"set_placeholder": False}):
+            self.assertIsNot(get_bootstrap_settings(), bootstrap_settings)
+            self.assertFalse(get_bootstrap_setting("set_placeholder"))
+        self.assertTrue(get_bootstrap_setting("set_placeholder"))
+        with self.settings(USE_I18N=False):
+            self.assertFalse(get_bootstrap_setting("use_i18n"))
+        self.assertTrue(get_bootstrap_setting("use_i18n"))
+
     def test_jquery_url(self):
         self.assertEqual(
             jquery_url(),
@@ -0,0 +1,90 @@
+from unittest import mock
+
+from django.forms import formset_factory
+from django.test import TestCase
+
+from bootstrap4.forms import render_field, render_form, render_formset
+from bootstrap4.renderers import FormRenderer, FormsetRenderer, InlineFieldRenderer
+from bootstrap4.signals import (
+    field_rendered,
+    form_rendered,
+    formset_rendered,
+    setting_read,
+    tag_rendered,
+    template_loaded,
+)
+
+from .forms import TestForm
+from .utils import render_template_with_form
+
+
+class RenderedSignalsTest(TestCase):
+    def connect(self, signal):
+        events = []
+
+        def receiver(**kwargs):
+            events.append(kwargs)
+
+        signal.connect(receiver)
+        self.addCleanup(signal.disconnect, receiver)
+        return events
+
+    def test_formset_rendered(self):
+        events = self.connect(formset_rendered)
+        formset = formset_factory(TestForm, extra=2)()
+        res = render_formset(formset, layout="horizontal")
+        self.assertEqual(len(events), 1)
+        self.assertIs(events[0]["sender"], FormsetRenderer)
+        self.assertIs(events[0]["formset"], formset)
+        self.assertEqual(events[0]["layout"], "horizontal")
+        self.assertEqual(events[0]["html_size"], len(res))
+        self.assertGreater(events[0]["duration"], 0)
+
+    def test_form_rendered(self):
+        events = self.connect(form_rendered)
+        form = TestForm()
+        res = render_form(form)
+        self.assertEqual(len(events), 1)
+        self.assertIs(events[0]["sender"], FormRenderer)
+        self.assertIs(events[0]["form"], form)
+        self.assertEqual(events[0]["html_size"], len(res))
+
+    def test_field_rendered(self):
+        events = self.connect(field_rendered)
+        form = TestForm()
+        res = render_field(form["category2"], layout="inline")
+        self.assertEqual(len(events), 1)
+        self.assertIs(events[0]["sender"], InlineFieldRenderer)
+        self.assertIs(events[0]["field"].field, form.fields["category2"])
+        self.assertEqual(events[0]["layout"], "inline")
+        self.assertEqual(events[0]["html_size"], len(res))
+        self.assertEqual(events[0]["widget_class"].__name__, "CheckboxSelectMultiple")
+        self.assertFalse(events[0]["list_to_class_applied"])
+
+        # RadioSelectButtonGroup has its own template, so list_to_class adds the Bootstrap classes
+        render_field(form["category5"])
+        self.assertTrue(events[1]["list_to_class_applied"])
+
+    def test_tag_rendered(self):
+        events = self.connect(tag_rendered)
+        render_template_with_form("{% bootstrap_css %}{% bootstrap_form form %}")
+        # Tag functions that are called by other tags, such as bootstrap_css_url, are not reported
+        self.assertEqual([event["tag_name"] for event in events], ["bootstrap_css", "bootstrap_form"])
+        self.assertGreater(events[1]["duration"], 0)
+
+    def test_template_loaded(self):
+        events = self.connect(template_loaded)
+        render_form(TestForm(data={}))
+        render_form(TestForm(data={}))
+        self.assertEqual([event["template_name"] for event in events], ["bootstrap4/form_errors.html"] * 2)
+        self.assertTrue(events[1]["cached"])
+
+    def test_setting_read(self):
+        events = self.connect(setting_read)
+        render_field(TestForm()["subject"])
+        self.assertIn("set_placeholder", [event["name"] for event in events])
+
+    def test_no_receivers(self):
+        with mock.patch("bootstrap4.renderers.time.perf_counter") as perf_counter:
+            render_form(TestForm())
+        perf_counter.assert_not_called()
@@ -1,7 +1,21 @@
-from django.test import TestCase
+import tempfile
+from pathlib import Path
+
+from django.test import TestCase, override_settings
+from django.utils.autoreload import file_changed
+from django.utils.safestring import mark_safe
 
 from bootstrap4.text import text_concat, text_value
-from bootstrap4.utils import add_css_class, render_tag
+from bootstrap4.utils import (
+    add_choice_list_classes,
+    add_css_class,
+    get_cached_template,
+    is_template_overridden,
+    render_field_errors,
+    render_field_help,
+    render_tag,
+    render_template_file,
+)
 
 
 class UtilsTest(TestCase):
@@ -29,3 +43,72 @@ class UtilsTest(TestCase):
         self.assertEqual(render_tag("span"), "<span></span>")
         self.assertEqual(render_tag("span", content="foo"), "<span>foo</span>")
         self.assertEqual(render_tag("span", attrs={"bar": 123}, content="foo"), '<span bar="123">foo</span>')
+
+    def test_add_choice_list_classes(self):
+        html = (
+            '<div id="id_choice">\n'
+            "  <div><label>Group</label><div>\n"
+            '    <label for="id_choice_0"><input type="checkbox" name="choice" value="a" class="one  two"'
+            " data-x='a\"b' checked> A &amp; &#x27;B&#x27;</label>\n"
+            "  </div></div>\n"
+            "</div><label><input></label>"
+        )
+        self.assertEqual(
+            add_choice_list_classes(html, "checkbox form-control-sm", "form-check"),
+            '<div class="checkbox form-control-sm" id="id_choice">\n'
+            '<div class="form-check"><label class="form-check-label">Group</label><div class="form-check">\n'
+            '<label class="form-check-label" for="id_choice_0"><input checked="" class="one two form-check-input"'
+            ' data-x=\'a"b\' name="choice" type="checkbox" value="a"/> A &amp; \'B\'</label>\n'
+            "</div></div>\n"
+            "</div><label><input/></label>",
+        )
+
+
+class CachedTemplateTest(TestCase):
+    def test_get_cached_template(self):
+        template = get_cached_template("bootstrap4/field_help_text.html")
+        self.assertIs(get_cached_template("bootstrap4/field_help_text.html"), template)
+
+    def test_cached_template_reset_on_templates_change(self):
+        template = get_cached_template("bootstrap4/field_help_text.html")
+        with override_settings(
+            TEMPLATES=[{"BACKEND": "django.template.backends.django.DjangoTemplates", "APP_DIRS": True}]
+        ):
+            self.assertIsNot(get_cached_template("bootstrap4/field_help_text.html"), template)
+
+    def test_cached_template_reset_on_file_changed(self):
+        template = get_cached_template("bootstrap4/field_help_text.html")
+        file_changed.send(sender=None, file_path=Path("bootstrap4/field_help_text.html"))
+        self.assertIsNot(get_cached_template("bootstrap4/field_help_text.html"), template)
+
+    def test_render_field_errors(self):
+        field_errors = ["<required>", mark_safe("<b>invalid</b>")]
+        self.assertFalse(is_template_overridden("bootstrap4/field_errors.html"))
+        self.assertEqual(
+            render_field_errors(field_errors),
+            render_template_file("bootstrap4/field_errors.html", context={"field_errors": field_errors}),
+        )
+
+    def test_render_field_help(self):
+        self.assertFalse(is_template_overridden("bootstrap4/field_help_text.html"))
+        for field_help in ["<help>", mark_safe("<b>help</b>")]:
+            self.assertEqual(
+                render_field_help(field_help),
+                render_template_file("bootstrap4/field_help_text.html", context={"field_help": field_help}),
+            )
+
+    def test_is_template_overridden(self):
+        with tempfile.TemporaryDirectory() as templates_dir:
+            (Path(templates_dir) / "bootstrap4").mkdir()
+            (Path(templates_dir) / "bootstrap4" / "field_errors.html").write_text("errors")
+            templates = [
+                {
+                    "BACKEND": "django.template.backends.django.DjangoTemplates",
+                    "DIRS": [templates_dir],
+                    "APP_DIRS": True,
+                }
+            ]
+            with override_settings(TEMPLATES=templates):
+                self.assertTrue(is_template_overridden("bootstrap4/field_errors.html"))
+                self.assertFalse(is_template_overridden("bootstrap4/field_help_text.html"))
+        self.assertFalse(is_template_overridden("bootstrap4/field_errors.html"))